@@ -0,0 +1,47 @@
+"""
+Shared HTTP session for SMF Player's API clients.
+LastFM, AcoustID and Spotify requests all go through one connection pool.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Keep-alive pool sizes; each host gets its own pool of up to POOL_MAXSIZE connections
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 64
+
+# Connection failures are retried here; throttled LastFM and AcoustID responses
+# are retried by APIBase so the retries stay under each host's rate limit
+CONNECTION_RETRY = Retry(total=2, backoff_factor=0.2)
+
+# spotipy relies on urllib3 to retry throttled and failed calls; these match its defaults
+SPOTIFY_API_PREFIX = 'https://api.spotify.com/'
+SPOTIFY_RETRY = Retry(
+    total=3,
+    status=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE'])
+)
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that keeps connections alive between requests."""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'SMF Player/1.0'
+    
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=CONNECTION_RETRY
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    # The longest matching prefix wins, so Web API calls get spotipy's retry policy
+    session.mount(SPOTIFY_API_PREFIX, HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=SPOTIFY_RETRY
+    ))
+    return session
+
+
+SESSION = _create_session()
\ No newline at end of file
@@ -3,25 +3,50 @@ AcoustID API integration for SMF Player.
 Handles audio fingerprinting and metadata lookup using AcoustID service.
 """
 
-import acoustid
-from acoustid import fingerprint_file
+import os
+import re
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Optional, Tuple
+from urllib.parse import quote
 
 from .api_base import APIBase
+from ..database.cache import CacheManager
 from ..utils.logging_utils import log_error, log_warning
 
+ACOUSTID_LOOKUP_URL = 'https://api.acoustid.org/v2/lookup'
+
+# Separators between the main artist and featured artists
+ARTIST_SEPARATOR = re.compile(r'[;,]')
+
+
+@lru_cache(maxsize=None)
+def have_chromaprint() -> bool:
+    """
+    Check whether fingerprints can be computed in-process.
+    
+    That needs pyacoustid's libchromaprint binding and audioread; without them
+    fingerprinting shells out to the fpcalc binary from the Chromaprint tools.
+    Only looks the modules up, without importing them.
+    
+    Returns:
+        True if the chromaprint binding and audioread are installed
+    """
+    return find_spec('chromaprint') is not None and find_spec('audioread') is not None
+
 
 class AcoustIDAPI(APIBase):
     """Handles AcoustID API interactions for audio fingerprinting."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[CacheManager] = None):
         """
         Initialize AcoustID API client.
         
         Args:
             api_key: AcoustID API key
+            cache: Optional cache for lookup results keyed by fingerprint
         """
-        super().__init__(api_key)
+        super().__init__(api_key, cache)
     
     def get_metadata_from_file(self, file_path: str) -> Optional[Tuple[str, str]]:
         """
@@ -38,18 +63,18 @@ class AcoustIDAPI(APIBase):
             return None
         
         try:
-            # Generate fingerprint
-            fingerprint_data = fingerprint_file(file_path, force_fpcalc=True)
-            if not fingerprint_data or len(fingerprint_data) < 2:
+            fingerprint_data = self._get_fingerprint(file_path)
+            if fingerprint_data is None:
                 log_warning(f"Could not generate fingerprint for {file_path}", self.__class__.__name__)
                 return None
             
-            duration = fingerprint_data[0]
-            fingerprint = str(fingerprint_data[1])
+            duration, fingerprint = fingerprint_data
             
-            # Clean fingerprint string
-            if fingerprint.startswith("b'") and fingerprint.endswith("'"):
-                fingerprint = fingerprint[2:-1]
+            # Serve repeated lookups from the cache
+            if self.cache is not None:
+                cached = self.cache.get_acoustid_metadata(fingerprint)
+                if cached:
+                    return cached
             
             # Build API URL
             url = self._build_lookup_url(duration, fingerprint)
@@ -60,12 +85,53 @@ class AcoustIDAPI(APIBase):
                 return None
             
             # Parse response
-            return self._parse_lookup_response(data)
+            result = self._parse_lookup_response(data)
+            if result and self.cache is not None:
+                self.cache.set_acoustid_metadata(fingerprint, *result)
+            
+            return result
             
         except Exception as e:
             log_error(f"Error getting metadata from AcoustID", e, self.__class__.__name__)
             return None
     
+    def _get_fingerprint(self, file_path: str) -> Optional[Tuple[float, str]]:
+        """
+        Fingerprint an audio file, reusing the cached result while the file is unchanged.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Tuple of (duration, fingerprint) or None if it could not be generated
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        
+        # fpcalc decodes the audio, so skip it for files seen before
+        if self.cache is not None:
+            cached = self.cache.get_fingerprint(path, stat.st_size, stat.st_mtime_ns)
+            if cached:
+                return cached
+        
+        # pyacoustid is only needed once an untagged file is looked up
+        from acoustid import fingerprint_file
+        
+        fingerprint_data = fingerprint_file(path, force_fpcalc=not have_chromaprint())
+        if not fingerprint_data or len(fingerprint_data) < 2:
+            return None
+        
+        duration, fingerprint = fingerprint_data[0], fingerprint_data[1]
+        
+        # Chromaprint output is ASCII; decode it rather than stripping the bytes repr
+        if isinstance(fingerprint, bytes):
+            fingerprint = fingerprint.decode('ascii')
+        
+        if self.cache is not None:
+            self.cache.set_fingerprint(path, stat.st_size, stat.st_mtime_ns, duration, fingerprint)
+        
+        return duration, fingerprint
+    
     def _build_lookup_url(self, duration: float, fingerprint: str) -> str:
         """
         Build the AcoustID lookup URL.
@@ -77,15 +143,15 @@ class AcoustIDAPI(APIBase):
         Returns:
             Complete API URL
         """
-        base_url = 'https://api.acoustid.org/v2/lookup'
-        params = {
-            'client': self.api_key,
-            'meta': 'recordings+releasegroups+compress',
-            'duration': str(int(duration)),
-            'fingerprint': fingerprint
-        }
-        
-        return self._build_url(base_url, params)
+        # Fingerprints are URL-safe base64, so only the API key needs quoting;
+        # '+' separates the meta values the same way an encoded space would.
+        # Only recording titles and artists are parsed, so release groups
+        # are not requested; they made up most of the response body
+        return (
+            f"{ACOUSTID_LOOKUP_URL}?client={quote(self.api_key, safe='')}"
+            f"&meta=recordings+compress"
+            f"&duration={int(duration)}&fingerprint={fingerprint}"
+        )
     
     def _parse_lookup_response(self, data: dict) -> Optional[Tuple[str, str]]:
         """
@@ -97,22 +163,17 @@ class AcoustIDAPI(APIBase):
         Returns:
             Tuple of (artist, title) or None if not found
         """
+        import acoustid
+        
         try:
-            # Use acoustid library's parser
-            results = list(acoustid.parse_lookup_result(data))
-            
-            for result in results:
+            # Use acoustid library's parser; it yields lazily, so stop at the first usable match
+            for result in acoustid.parse_lookup_result(data):
                 if result and len(result) >= 2 and None not in result[-2:]:
                     title = result[-2]
                     artist = result[-1]
                     
                     # Clean artist name (remove features, etc.)
-                    if ';' in artist:
-                        artist = artist.split(';')[0]
-                    if ',' in artist:
-                        artist = artist.split(',')[0]
-                    
-                    artist = artist.strip()
+                    artist = ARTIST_SEPARATOR.split(artist, maxsplit=1)[0].strip()
                     title = title.strip()
                     
                     if artist and title:
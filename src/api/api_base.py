@@ -3,26 +3,91 @@ Base class for API clients in SMF Player.
 Provides common functionality for HTTP requests and JSON parsing.
 """
 
-import urllib.request
 import urllib.parse
 import json
+import random
+import threading
+import time
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
+import requests
+
+from ._http import SESSION
+from ..config import HTTP_CACHE_MAX_AGE
+from ..database.cache import CacheManager
 from ..utils.logging_utils import get_logger, log_error
 
+# orjson is optional; it decodes the larger AcoustID payloads noticeably faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Requests per second allowed to each host; AcoustID documents 3 per second
+DEFAULT_RATE_LIMIT = 1.0
+HOST_RATE_LIMITS = {
+    'api.acoustid.org': 3.0,
+}
+
+# Retries for throttled (429) or unavailable (503) responses
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 10.0
+RETRY_STATUS_CODES = (429, 503)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests are sent."""
+    
+    def __init__(self, rate: float, capacity: float = 2.0):
+        """
+        Initialize the bucket full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # Reserve the token now so concurrent callers queue up behind it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+
 
 class APIBase(ABC):
     """Base class for API clients with common HTTP request functionality."""
     
-    def __init__(self, api_key: str):
+    # Connection pool shared by all clients, so TCP/TLS sessions are reused
+    _session = SESSION
+    
+    # Rate limiters shared by all clients, keyed by host
+    _buckets = {}
+    _buckets_lock = threading.Lock()
+    
+    def __init__(self, api_key: str, cache: Optional[CacheManager] = None):
         """
         Initialize the API client.
         
         Args:
             api_key: API key for authentication
+            cache: Optional cache for lookup results and HTTP responses
         """
         self.api_key = api_key
+        self.cache = cache
         self.logger = get_logger(self.__class__.__name__)
     
     @abstractmethod
@@ -46,22 +111,49 @@ class APIBase(ABC):
         Returns:
             Parsed JSON response or None if request failed
         """
+        cached = self.cache.get_http_response(url) if self.cache is not None else None
+        
         try:
-            self.logger.debug(f"Making GET request to: {url}")
+            # Responses fetched recently are reused without asking the server
+            if cached and time.time() - cached[3] < HTTP_CACHE_MAX_AGE:
+                self.logger.debug("Serving cached response for: %s", url)
+                return json_loads(cached[0])
+            
+            self.logger.debug("Making GET request to: %s", url)
+            
+            # Let the server answer 304 instead of resending an unchanged body
+            headers = {}
+            if cached:
+                if cached[1]:
+                    headers['If-None-Match'] = cached[1]
+                if cached[2]:
+                    headers['If-Modified-Since'] = cached[2]
+            
+            response = self._get_with_retries(url, headers, timeout)
+            
+            if response.status_code == 304 and cached:
+                self.logger.debug("Cached response still valid for: %s", url)
+                self.cache.touch_http_response(url)
+                return json_loads(cached[0])
+            
+            response.raise_for_status()
+            raw = response.content
+            
+            self.logger.debug("Request successful, received %d bytes", len(raw))
+            data = json_loads(raw)
             
-            request = urllib.request.Request(url)
-            request.add_header('User-Agent', 'SMF Player/1.0')
+            if self.cache is not None:
+                self.cache.set_http_response(
+                    url, raw, response.headers.get('ETag'), response.headers.get('Last-Modified')
+                )
             
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                data = json.load(response)
-                self.logger.debug(f"Request successful, received {len(str(data))} bytes")
-                return data
+            return data
                 
-        except urllib.error.HTTPError as e:
-            log_error(f"HTTP error {e.code} when requesting {url}", e, self.__class__.__name__)
+        except requests.HTTPError as e:
+            log_error(f"HTTP error {e.response.status_code} when requesting {url}", e, self.__class__.__name__)
             return None
-        except urllib.error.URLError as e:
-            log_error(f"URL error when requesting {url}", e, self.__class__.__name__)
+        except requests.RequestException as e:
+            log_error(f"Request error when requesting {url}", e, self.__class__.__name__)
             return None
         except json.JSONDecodeError as e:
             log_error(f"JSON decode error for response from {url}", e, self.__class__.__name__)
@@ -70,6 +162,68 @@ class APIBase(ABC):
             log_error(f"Unexpected error when requesting {url}", e, self.__class__.__name__)
             return None
     
+    def _get_with_retries(self, url: str, headers: Dict[str, str], timeout: int) -> requests.Response:
+        """
+        Send a GET request under the host's rate limit, retrying throttled responses.
+        
+        Args:
+            url: URL to request
+            headers: Extra request headers
+            timeout: Request timeout in seconds
+            
+        Returns:
+            Final response, which may still be an error status
+        """
+        host = urllib.parse.urlsplit(url).hostname
+        bucket = self._get_bucket(host)
+        
+        for attempt in range(MAX_RETRIES + 1):
+            bucket.acquire()
+            response = self._session.get(url, headers=headers, timeout=timeout)
+            
+            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                return response
+            
+            delay = self._get_retry_delay(response.headers, attempt)
+            self.logger.debug("HTTP %s from %s, retrying in %.1fs", response.status_code, host, delay)
+            time.sleep(delay)
+    
+    @classmethod
+    def close_session(cls):
+        """Close the pooled connections shared by all API clients."""
+        cls._session.close()
+    
+    @classmethod
+    def _get_bucket(cls, host: str) -> TokenBucket:
+        """Get the rate limiter for a host, creating it on first use."""
+        with cls._buckets_lock:
+            bucket = cls._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT))
+                cls._buckets[host] = bucket
+            return bucket
+    
+    @staticmethod
+    def _get_retry_delay(headers, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a throttled request.
+        
+        Args:
+            headers: Headers of the throttled response
+            attempt: Zero-based number of the failed attempt
+            
+        Returns:
+            Delay in seconds
+        """
+        # Honor Retry-After when given in seconds, otherwise back off exponentially with jitter
+        retry_after = headers.get('Retry-After')
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = 2 ** attempt + random.random()
+        
+        return min(delay, MAX_RETRY_DELAY)
+    
     def _build_url(self, base_url: str, params: Dict[str, str]) -> str:
         """
         Build a URL with query parameters.
@@ -3,26 +3,62 @@ LastFM API integration for SMF Player.
 Handles album cover art and track information retrieval from LastFM.
 """
 
-import urllib.request
-from PIL import Image
-from typing import Optional, Dict, Any
+import io
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from PIL import Image, features
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import quote
 
 from .api_base import APIBase
+from ..config import ALBUM_ART_CACHE_DIR, ALBUM_ART_CACHE_MAX_BYTES
+from ..database.cache import CacheManager
+from ..utils.image_processor import ImageProcessor
 from ..utils.logging_utils import log_error, log_warning
 
+# Cached thumbnails are WebP when Pillow was built with libwebp, JPEG otherwise
+THUMBNAIL_FORMAT = 'WEBP' if features.check('webp') else 'JPEG'
+THUMBNAIL_QUALITY = 80
+
+# Image sizes LastFM offers and their width in pixels, smallest first
+IMAGE_SIZE_PIXELS = (
+    ('small', 34),
+    ('medium', 64),
+    ('large', 174),
+    ('extralarge', 300),
+)
+
+# Number of track.getInfo results kept in memory for the session
+TRACK_INFO_CACHE_SIZE = 1024
+
 
 class LastFMAPI(APIBase):
     """Handles LastFM API interactions for album art and track info."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[CacheManager] = None):
         """
         Initialize LastFM API client.
         
         Args:
             api_key: LastFM API key
+            cache: Optional cache for album art URLs and HTTP responses
         """
-        super().__init__(api_key)
+        super().__init__(api_key, cache)
         self.base_url = 'http://ws.audioscrobbler.com/2.0/'
+        
+        # The fixed query parameters are encoded once; only names are quoted per call
+        common_params = f"format=json&api_key={quote(api_key or '', safe='')}"
+        self._track_info_prefix = f"{self.base_url}?method=track.getInfo&{common_params}"
+        self._artist_search_prefix = f"{self.base_url}?method=artist.search&{common_params}"
+        
+        # track.getInfo requests in flight, so concurrent callers share one request,
+        # and recent results kept in least-recently-used order
+        self._pending_track_info = {}
+        self._track_info_cache = OrderedDict()
+        self._pending_lock = threading.Lock()
     
     def get_track_info(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
         """
@@ -39,6 +75,48 @@ class LastFMAPI(APIBase):
             log_warning("LastFM API key not configured", self.__class__.__name__)
             return None
         
+        key = (artist.lower(), track.lower())
+        
+        with self._pending_lock:
+            if key in self._track_info_cache:
+                self._track_info_cache.move_to_end(key)
+                return self._track_info_cache[key]
+            
+            pending = self._pending_track_info.get(key)
+            if pending is None:
+                future = Future()
+                self._pending_track_info[key] = future
+        
+        # Another thread is already fetching this track, wait for its result
+        if pending is not None:
+            return pending.result()
+        
+        result = None
+        try:
+            result = self._fetch_track_info(artist, track)
+            return result
+        finally:
+            future.set_result(result)
+            with self._pending_lock:
+                del self._pending_track_info[key]
+                
+                # Misses aren't kept so they are retried on the next request
+                if result is not None:
+                    self._track_info_cache[key] = result
+                    if len(self._track_info_cache) > TRACK_INFO_CACHE_SIZE:
+                        self._track_info_cache.popitem(last=False)
+    
+    def _fetch_track_info(self, artist: str, track: str) -> Optional[Dict[str, Any]]:
+        """
+        Request track information from LastFM.
+        
+        Args:
+            artist: Artist name
+            track: Track name
+            
+        Returns:
+            Dictionary containing track information or None if not found
+        """
         try:
             url = self._build_track_info_url(artist, track)
             data = self._make_get_request(url)
@@ -60,6 +138,30 @@ class LastFMAPI(APIBase):
         """
         Get album art URL for a track.
         
+        Args:
+            artist: Artist name
+            track: Track name
+            size: Image size ('small', 'medium', 'large', 'extralarge')
+            
+        Returns:
+            URL of album art or None if not found
+        """
+        # Replayed tracks are served from the cache instead of track.getInfo
+        if self.cache is not None:
+            cached = self.cache.get_album_art_url(artist, track, size)
+            if cached:
+                return cached
+        
+        image_url = self._lookup_album_art_url(artist, track, size)
+        if image_url and self.cache is not None:
+            self.cache.set_album_art_url(artist, track, size, image_url)
+        
+        return image_url
+    
+    def _lookup_album_art_url(self, artist: str, track: str, size: str) -> Optional[str]:
+        """
+        Look up the album art URL for a track with track.getInfo.
+        
         Args:
             artist: Artist name
             track: Track name
@@ -95,7 +197,30 @@ class LastFMAPI(APIBase):
         
         return None
     
-    def download_album_art(self, artist: str, track: str, size: str = 'large') -> Optional[Image.Image]:
+    @staticmethod
+    def image_size_for(display_size: Tuple[int, int]) -> str:
+        """
+        Pick the smallest LastFM image size that still covers a display size.
+        
+        Args:
+            display_size: Size the image will be displayed at
+            
+        Returns:
+            LastFM image size name, the largest one if none covers it
+        """
+        needed = max(display_size)
+        for size, pixels in IMAGE_SIZE_PIXELS:
+            if pixels >= needed:
+                return size
+        return IMAGE_SIZE_PIXELS[-1][0]
+    
+    def download_album_art(
+        self,
+        artist: str,
+        track: str,
+        size: str = 'large',
+        target_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[Image.Image]:
         """
         Download album art as PIL Image.
         
@@ -103,6 +228,8 @@ class LastFMAPI(APIBase):
             artist: Artist name
             track: Track name
             size: Image size ('small', 'medium', 'large', 'extralarge')
+            target_size: Size the image will be displayed at, used to decode JPEGs at a
+                reduced scale and to store a thumbnail of that size in the cache
             
         Returns:
             PIL Image object or None if not found/downloaded
@@ -111,15 +238,155 @@ class LastFMAPI(APIBase):
         if not image_url:
             return None
         
+        # A thumbnail stored on an earlier play skips the download and full-size decode
+        if target_size is not None and self.cache is not None:
+            thumbnail = self.cache.get_album_art_image(artist, track, size, target_size)
+            if thumbnail:
+                try:
+                    image = Image.open(io.BytesIO(thumbnail))
+                    image.load()
+                    return image
+                except Exception as e:
+                    log_error(f"Error decoding cached album art", e, self.__class__.__name__)
+        
         try:
-            response = urllib.request.urlopen(image_url)
-            image = Image.open(response)
+            data = self._get_image_bytes(image_url)
+            if data is None:
+                return None
+            
+            image = Image.open(io.BytesIO(data))
+            
+            # Let libjpeg decode at a reduced scale when the image is larger than needed
+            if target_size is not None:
+                ImageProcessor._draft_jpeg(image, *target_size)
+            image.load()
+            
+            if target_size is not None and self.cache is not None:
+                image = self._cache_thumbnail(artist, track, size, image, target_size)
+            
             return image
             
         except Exception as e:
             log_error(f"Error downloading album art from {image_url}", e, self.__class__.__name__)
             return None
     
+    def _get_image_bytes(self, image_url: str) -> Optional[bytes]:
+        """
+        Get album art bytes from the on-disk cache, downloading them on a miss.
+        
+        Tracks from the same album share an image URL, so they share one cached file.
+        
+        Args:
+            image_url: URL of the image
+            
+        Returns:
+            Image bytes or None if the download failed
+        """
+        cache_path = os.path.join(
+            ALBUM_ART_CACHE_DIR, hashlib.sha1(image_url.encode()).hexdigest() + '.img'
+        )
+        
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                data = cache_file.read()
+            # Refresh the modification time, which orders eviction
+            os.utime(cache_path)
+            return data
+        except OSError:
+            pass
+        
+        # Read the body in one go instead of letting PIL issue many small socket reads;
+        # closing the response hands the connection back to the pool even on errors
+        with self._session.get(image_url, timeout=10) as response:
+            response.raise_for_status()
+            data = response.content
+            headers = response.headers
+        
+        expected_length = headers.get('Content-Length')
+        if expected_length is not None and 'Content-Encoding' not in headers \
+                and int(expected_length) != len(data):
+            log_warning(f"Incomplete album art download from {image_url}", self.__class__.__name__)
+            return None
+        
+        try:
+            os.makedirs(ALBUM_ART_CACHE_DIR, exist_ok=True)
+            
+            # Write to a temporary file first so readers never see a partial image
+            temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(data)
+            os.replace(temp_path, cache_path)
+            
+            self._trim_image_cache()
+        except OSError as e:
+            log_error(f"Error caching album art on disk", e, self.__class__.__name__)
+        
+        return data
+    
+    @staticmethod
+    def _trim_image_cache():
+        """Delete the least recently used cached images once the cache is over its size limit."""
+        entries = []
+        total = 0
+        
+        with os.scandir(ALBUM_ART_CACHE_DIR) as scan:
+            for entry in scan:
+                if entry.is_file() and entry.name.endswith('.img'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        
+        if total <= ALBUM_ART_CACHE_MAX_BYTES:
+            return
+        
+        for mtime, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= ALBUM_ART_CACHE_MAX_BYTES:
+                break
+    
+    def _cache_thumbnail(
+        self,
+        artist: str,
+        track: str,
+        size: str,
+        image: Image.Image,
+        target_size: Tuple[int, int]
+    ) -> Image.Image:
+        """
+        Shrink downloaded album art to the display size and store it compressed.
+        
+        Args:
+            artist: Artist name
+            track: Track name
+            size: Image size the URL was looked up for
+            image: Downloaded image
+            target_size: Size the image will be displayed at
+            
+        Returns:
+            The thumbnail, which is returned to the caller in place of the full image
+        """
+        try:
+            # Palette and bilevel images only resize with NEAREST, so they become RGB first;
+            # other modes are shrunk before the conversion, which then runs on fewer pixels
+            if image.mode in ('1', 'P'):
+                image = image.convert('RGB')
+            # Cached thumbnails are only shown at display size, where box filtering holds up
+            thumbnail = ImageProcessor.create_thumbnail(image, target_size, fast=True)
+            if thumbnail.mode != 'RGB':
+                thumbnail = thumbnail.convert('RGB')
+            
+            buffer = io.BytesIO()
+            thumbnail.save(buffer, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+            self.cache.set_album_art_image(artist, track, size, target_size, buffer.getvalue())
+            return thumbnail
+        except Exception as e:
+            log_error(f"Error caching album art thumbnail", e, self.__class__.__name__)
+            return image
+    
     def get_album_name(self, artist: str, track: str) -> Optional[str]:
         """
         Get album name for a track.
@@ -154,15 +421,10 @@ class LastFMAPI(APIBase):
         Returns:
             Complete API URL
         """
-        params = {
-            'method': 'track.getInfo',
-            'format': 'json',
-            'api_key': self.api_key,
-            'artist': artist,
-            'track': track
-        }
-        
-        return self._build_url(self.base_url, params)
+        return (
+            f"{self._track_info_prefix}"
+            f"&artist={quote(artist, safe='')}&track={quote(track, safe='')}"
+        )
     
     def is_configured(self) -> bool:
         """
@@ -188,15 +450,7 @@ class LastFMAPI(APIBase):
             return None
         
         try:
-            params = {
-                'method': 'artist.search',
-                'format': 'json',
-                'api_key': self.api_key,
-                'artist': artist_name,
-                'limit': str(limit)
-            }
-            
-            url = self._build_url(self.base_url, params)
+            url = f"{self._artist_search_prefix}&artist={quote(artist_name, safe='')}&limit={int(limit)}"
             data = self._make_get_request(url)
             
             if data is None:
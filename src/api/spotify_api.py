@@ -3,29 +3,73 @@ Spotify API integration for SMF Player.
 Handles song recommendations and artist/track search using Spotify Web API.
 """
 
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
-from typing import List, Dict, Optional, Tuple
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Tuple
 
+from ._http import SESSION
+from ..config import SPOTIFY_TOKEN_CACHE_PATH
+from ..database.cache import CacheManager
 from ..utils.logging_utils import get_logger, log_error, log_warning
 
+# Search result pages fetched when looking for an artist through their albums;
+# they start after the top result, which is checked on its own first
+SEARCH_PAGE_SIZE = 50
+ALBUM_SEARCH_OFFSETS = (1, 51)
+
+# Most tracks the recommendations endpoint returns per request
+MAX_RECOMMENDATIONS = 100
+
+# Seconds a failed artist ID search is remembered before it is retried
+ARTIST_MISS_TTL = 10 * 60
+
 
 class SpotifyAPI:
     """Handles Spotify API interactions for recommendations and search."""
     
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self, client_id: str, client_secret: str, cache: Optional[CacheManager] = None):
         """
         Initialize Spotify API client.
         
         Args:
             client_id: Spotify client ID
             client_secret: Spotify client secret
+            cache: Optional cache for artist ID lookups
         """
         self.client_id = client_id
         self.client_secret = client_secret
-        self.spotify = None
+        self.cache = cache
         self.logger = get_logger(self.__class__.__name__)
-        self._initialize_client()
+        
+        # The client is created on first use so spotipy isn't imported at startup
+        self._spotify = None
+        self._client_initialized = False
+        self._client_lock = threading.Lock()
+        
+        # Artist ID search results for this session, keyed by (kind, artist, name);
+        # values are (artist_id or None, time stored)
+        self._artist_ids = {}
+        
+        # Result pages are independent, so they are requested concurrently
+        self._search_pool = ThreadPoolExecutor(
+            max_workers=len(ALBUM_SEARCH_OFFSETS), thread_name_prefix="spotify-search"
+        )
+    
+    def close(self):
+        """Stop the search page workers; page requests already running are left to finish."""
+        self._search_pool.shutdown(wait=False, cancel_futures=True)
+    
+    @property
+    def spotify(self):
+        """Spotify client, or None if it isn't configured or failed to initialize."""
+        if not self._client_initialized:
+            with self._client_lock:
+                if not self._client_initialized:
+                    self._initialize_client()
+                    self._client_initialized = True
+        return self._spotify
     
     def _initialize_client(self):
         """Initialize the Spotify client with credentials."""
@@ -34,16 +78,40 @@ class SpotifyAPI:
             return
         
         try:
+            import spotipy
+            from spotipy.cache_handler import CacheFileHandler
+            from spotipy.oauth2 import SpotifyClientCredentials
+            
+            # Reuse a still-valid token from the last run instead of requesting a new one
+            os.makedirs(os.path.dirname(SPOTIFY_TOKEN_CACHE_PATH), exist_ok=True)
             client_credentials_manager = SpotifyClientCredentials(
                 client_id=self.client_id,
-                client_secret=self.client_secret
+                client_secret=self.client_secret,
+                cache_handler=CacheFileHandler(cache_path=SPOTIFY_TOKEN_CACHE_PATH)
             )
-            self.spotify = spotipy.Spotify(
-                client_credentials_manager=client_credentials_manager
+            # Share the other clients' connection pool instead of spotipy's own session
+            self._spotify = spotipy.Spotify(
+                client_credentials_manager=client_credentials_manager,
+                requests_session=SESSION
             )
         except Exception as e:
             log_error(f"Error initializing Spotify client", e, self.__class__.__name__)
-            self.spotify = None
+            self._spotify = None
+    
+    def warm_up(self):
+        """
+        Create the client and get an access token ahead of the first real search.
+        
+        A token cached by an earlier run is reused; otherwise this blocks on the
+        token request, so run it off the UI thread. No API request is made.
+        """
+        if not self.spotify:
+            return
+        
+        try:
+            self.spotify.auth_manager.get_access_token(as_dict=False)
+        except Exception as e:
+            log_warning(f"Spotify warm-up request failed: {e}", self.__class__.__name__)
     
     def search_artist_by_album(self, artist_name: str, album_name: str) -> Optional[str]:
         """
@@ -59,24 +127,39 @@ class SpotifyAPI:
         if not self.spotify:
             return None
         
+        known, artist_id = self._recall_artist_id('album', artist_name, album_name)
+        if known:
+            return artist_id
+        
+        artist_id = self._find_artist_by_album(artist_name, album_name)
+        self._remember_artist_id('album', artist_name, album_name, artist_id)
+        return artist_id
+    
+    def _find_artist_by_album(self, artist_name: str, album_name: str) -> Optional[str]:
+        """Search Spotify albums for an artist ID."""
+        query = f'album:{album_name} artist:{artist_name}'
+        
         try:
-            offset = 0
-            while offset < 100:  # Limit search to prevent infinite loops
-                results = self.spotify.search(
-                    q=f'album:{album_name} artist:{artist_name}',
-                    type='album',
-                    limit=50,
-                    offset=offset
-                )
-                
-                for album in results['albums']['items']:
-                    if artist_name.lower() == album['artists'][0]['name'].lower():
-                        return album['artists'][0]['id']
+            # The top result usually matches, so check it before fetching full pages
+            albums = self.spotify.search(q=query, type='album', limit=1)['albums']
+            if not albums['items']:
+                return None
+            
+            artist_id = self._match_album_artist(artist_name, albums['items'])
+            if artist_id:
+                return artist_id
+            
+            # Only pages that hold results are requested
+            offsets = tuple(offset for offset in ALBUM_SEARCH_OFFSETS if offset < albums['total'])
+            for results in self._search_pages(query, 'album', offsets):
+                items = results['albums']['items']
                 
-                offset += 50
+                artist_id = self._match_album_artist(artist_name, items)
+                if artist_id:
+                    return artist_id
                 
                 # Break if no more results
-                if len(results['albums']['items']) < 50:
+                if len(items) < SEARCH_PAGE_SIZE:
                     break
                     
         except Exception as e:
@@ -84,6 +167,84 @@ class SpotifyAPI:
         
         return None
     
+    @staticmethod
+    def _match_album_artist(artist_name: str, albums: List[Dict]) -> Optional[str]:
+        """Return the ID of the first album artist whose name matches, ignoring case."""
+        artist_name = artist_name.lower()
+        for album in albums:
+            if album['artists'][0]['name'].lower() == artist_name:
+                return album['artists'][0]['id']
+        return None
+    
+    def _recall_artist_id(self, kind: str, artist_name: str, name: str) -> Tuple[bool, Optional[str]]:
+        """
+        Look up a previous artist ID search in memory, then in the persistent cache.
+        
+        Args:
+            kind: Search type ('album' or 'track')
+            artist_name: Artist name
+            name: Album or track name
+            
+        Returns:
+            Tuple of (known, artist_id); artist_id is None for a remembered miss
+        """
+        key = (kind, artist_name.lower(), name.lower())
+        entry = self._artist_ids.get(key)
+        if entry is not None:
+            artist_id, stored_at = entry
+            if artist_id is not None or time.monotonic() - stored_at < ARTIST_MISS_TTL:
+                return True, artist_id
+        
+        if self.cache is not None:
+            artist_id = self.cache.get_spotify_artist_id(kind, artist_name, name)
+            if artist_id:
+                self._artist_ids[key] = (artist_id, time.monotonic())
+                return True, artist_id
+        
+        return False, None
+    
+    def _remember_artist_id(self, kind: str, artist_name: str, name: str, artist_id: Optional[str]):
+        """
+        Store the result of an artist ID search; only hits are persisted.
+        
+        Args:
+            kind: Search type ('album' or 'track')
+            artist_name: Artist name
+            name: Album or track name
+            artist_id: Spotify artist ID, or None if the search found nothing
+        """
+        self._artist_ids[(kind, artist_name.lower(), name.lower())] = (artist_id, time.monotonic())
+        if artist_id and self.cache is not None:
+            self.cache.set_spotify_artist_id(kind, artist_name, name, artist_id)
+    
+    def _search_pages(self, query: str, search_type: str, offsets: Tuple[int, ...]) -> Iterator[Dict]:
+        """
+        Request several search result pages at once and yield them in offset order.
+        
+        Pages not consumed yet are cancelled when the caller stops iterating.
+        
+        Args:
+            query: Spotify search query
+            search_type: Type of item to search for
+            offsets: Result offsets of the pages to fetch
+            
+        Yields:
+            Search results for each offset
+        """
+        futures = [
+            self._search_pool.submit(
+                self.spotify.search, q=query, type=search_type, limit=SEARCH_PAGE_SIZE, offset=offset
+            )
+            for offset in offsets
+        ]
+        
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+    
     def search_artist_by_track(self, artist_name: str, track_name: str) -> Optional[str]:
         """
         Search for an artist ID by track and artist name.
@@ -98,6 +259,16 @@ class SpotifyAPI:
         if not self.spotify:
             return None
         
+        known, artist_id = self._recall_artist_id('track', artist_name, track_name)
+        if known:
+            return artist_id
+        
+        artist_id = self._find_artist_by_track(artist_name, track_name)
+        self._remember_artist_id('track', artist_name, track_name, artist_id)
+        return artist_id
+    
+    def _find_artist_by_track(self, artist_name: str, track_name: str) -> Optional[str]:
+        """Search Spotify tracks for an artist ID."""
         try:
             offset = 0
             while offset < 150:  # Limit search to prevent infinite loops
@@ -109,7 +280,8 @@ class SpotifyAPI:
                 )
                 
                 for track in results['tracks']['items']:
-                    return track['artists'][0]['id']  # Return first match
+                    # Return first match
+                    return track['artists'][0]['id']
                 
                 offset += 50
                 
@@ -137,20 +309,29 @@ class SpotifyAPI:
             return []
         
         try:
+            # Many tracks lack previews, so ask for extra rather than sending a second request
             recommendations = self.spotify.recommendations(
                 seed_artists=[artist_id],
-                limit=limit
+                limit=min(MAX_RECOMMENDATIONS, limit * 3)
             )
             
             results = []
+            seen_artists = set()
             for track in recommendations['tracks']:
-                if track['preview_url']:  # Only include tracks with preview URLs
-                    results.append({
-                        'artist': track['artists'][0]['name'],
-                        'title': track['name'],
-                        'preview_url': track['preview_url'],
-                        'seed_artist': artist_id
-                    })
+                # Only include tracks with preview URLs, one per artist
+                track_artist_id = track['artists'][0]['id']
+                if not track['preview_url'] or track_artist_id in seen_artists:
+                    continue
+                
+                seen_artists.add(track_artist_id)
+                results.append({
+                    'artist': track['artists'][0]['name'],
+                    'title': track['name'],
+                    'preview_url': track['preview_url'],
+                    'seed_artist': artist_id
+                })
+                if len(results) == limit:
+                    break
             
             return results
             
@@ -10,9 +10,10 @@ import logging
 # Add the src directory to the Python path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.ui.main_frame import MainFrame
 from src.utils.logging_utils import setup_logging, log_error, log_info
 
+SPLASH_SIZE = (320, 80)
+
 
 class SMFPlayerApp(wx.App):
     """Main application class for SMF Player."""
@@ -29,6 +30,44 @@ class SMFPlayerApp(wx.App):
             
             log_info("Starting SMF Player application", "App")
             
+            # Show a window straight away; the main frame and the modules it
+            # pulls in are loaded once the event loop is running
+            self._splash = self._create_splash()
+            self._splash.Show()
+            self._splash.Update()
+            
+            wx.CallAfter(self._finish_init)
+            return True
+            
+        except Exception as e:
+            self._report_startup_error(e)
+            return False
+    
+    def _create_splash(self) -> wx.Frame:
+        """Create the lightweight window shown while the player loads."""
+        splash = wx.Frame(
+            None, title="SMF Player", size=SPLASH_SIZE,
+            style=wx.FRAME_NO_TASKBAR | wx.STAY_ON_TOP | wx.BORDER_NONE
+        )
+        splash.SetBackgroundColour("Black")
+        
+        label = wx.StaticText(splash, label="Loading SMF Player...")
+        label.SetForegroundColour("White")
+        
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.AddStretchSpacer()
+        sizer.Add(label, 0, wx.ALIGN_CENTER)
+        sizer.AddStretchSpacer()
+        splash.SetSizer(sizer)
+        
+        splash.Center()
+        return splash
+    
+    def _finish_init(self):
+        """Import and show the main frame, then close the splash window."""
+        try:
+            from src.ui.main_frame import MainFrame
+            
             # Create and show the main frame
             frame = MainFrame(None, -1)
             frame.Show()
@@ -37,16 +76,25 @@ class SMFPlayerApp(wx.App):
             self.SetTopWindow(frame)
             
             log_info("SMF Player application initialized successfully", "App")
-            return True
+            
+            from src.utils.image_processor import ImageProcessor
+            log_info(f"Image processing with {ImageProcessor.describe_build()}", "App")
             
         except Exception as e:
-            log_error("Failed to initialize SMF Player", e, "App")
-            wx.MessageBox(
-                f"Error starting SMF Player: {e}",
-                "Startup Error",
-                wx.OK | wx.ICON_ERROR
-            )
-            return False
+            self._report_startup_error(e)
+            self.ExitMainLoop()
+        
+        finally:
+            self._splash.Destroy()
+    
+    def _report_startup_error(self, e: Exception):
+        """Log a startup failure and tell the user about it."""
+        log_error("Failed to initialize SMF Player", e, "App")
+        wx.MessageBox(
+            f"Error starting SMF Player: {e}",
+            "Startup Error",
+            wx.OK | wx.ICON_ERROR
+        )
 
 
 def main():
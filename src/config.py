@@ -5,19 +5,48 @@ Centralizes API keys, database paths, and other settings.
 
 import os
 
-# API Keys - These should be set by the user
-SPOTIPY_CLIENT_ID = 'set-client-id-here'
-SPOTIPY_CLIENT_SECRET = 'set-client-secret-here'
-SPOTIPY_REDIRECT_URI = 'set-client-uri-here'
+# API Keys - These should be set by the user, here or in the environment.
+# They are read once at import and passed to the API clients directly
+SPOTIPY_CLIENT_ID = os.getenv('SPOTIPY_CLIENT_ID', 'set-client-id-here')
+SPOTIPY_CLIENT_SECRET = os.getenv('SPOTIPY_CLIENT_SECRET', 'set-client-secret-here')
+SPOTIPY_REDIRECT_URI = os.getenv('SPOTIPY_REDIRECT_URI', 'set-client-uri-here')
 
 # LastFM API key
-LASTFM_API_KEY = ''
+LASTFM_API_KEY = os.getenv('LASTFM_API_KEY', '')
 
 # AcoustID API key
-ACOUSTID_API_KEY = ''
+ACOUSTID_API_KEY = os.getenv('ACOUSTID_API_KEY', '')
 
 # Database configuration
 DEFAULT_PLAYLIST_DB = 'playing.db'
+DEFAULT_CACHE_DB = 'cache.db'
+
+# Maximum age of cached API lookups in seconds (30 days)
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Maximum age of cached Spotify recommendations in seconds (7 days); shorter than
+# other lookups since recommended previews come and go
+RECOMMENDATIONS_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+# Time in seconds an HTTP response is reused before it is revalidated (1 day)
+HTTP_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Cached HTTP responses not fetched or revalidated for this long (7 days) are
+# deleted when the cache opens, and at most this many of the newest are kept
+HTTP_CACHE_KEEP_AGE = 7 * HTTP_CACHE_MAX_AGE
+HTTP_CACHE_MAX_ENTRIES = 5000
+
+# On-disk cache of downloaded album art, trimmed to the given size in bytes
+ALBUM_ART_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'smf_player', 'art')
+ALBUM_ART_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# Button images scaled to BUTTON_SIZE, stored as raw pixels so they load without decoding
+BUTTON_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'smf_player', 'buttons')
+
+# Spotify access token, kept between runs until it expires
+SPOTIFY_TOKEN_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'smf_player', 'spotify_token.json'
+)
 
 # Supported audio file extensions
 SUPPORTED_AUDIO_EXTENSIONS = ('.mp3', '.flac', '.wav', '.aac', '.ogg')
@@ -26,10 +55,4 @@ SUPPORTED_AUDIO_EXTENSIONS = ('.mp3', '.flac', '.wav', '.aac', '.ogg')
 WINDOW_SIZE = (1300, 800)
 WINDOW_POSITION = (0, 0)
 ALBUM_ART_SIZE = (500, 500)
-BUTTON_SIZE = (25, 30)
-
-def setup_spotify_environment():
-    """Set up Spotify environment variables."""
-    os.environ['SPOTIPY_CLIENT_ID'] = SPOTIPY_CLIENT_ID
-    os.environ['SPOTIPY_CLIENT_SECRET'] = SPOTIPY_CLIENT_SECRET
-    os.environ['SPOTIPY_REDIRECT_URI'] = SPOTIPY_REDIRECT_URI
\ No newline at end of file
+BUTTON_SIZE = (25, 30)
\ No newline at end of file
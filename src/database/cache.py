@@ -0,0 +1,499 @@
+"""
+Cache database for SMF Player.
+Persists API lookup results so repeated plays can skip the network.
+"""
+
+import sqlite3
+import hashlib
+import json
+import threading
+import time
+from typing import Optional, Tuple, List, Dict
+
+from ..config import HTTP_CACHE_KEEP_AGE, HTTP_CACHE_MAX_ENTRIES
+from ..utils.logging_utils import get_logger, log_error
+
+
+class CacheManager:
+    """Manages a SQLite cache of API lookup results and raw HTTP responses."""
+    
+    def __init__(self, db_path: str = 'cache.db', max_age: int = 30 * 24 * 60 * 60):
+        """
+        Initialize the cache database.
+        
+        Args:
+            db_path: Path to the cache database file
+            max_age: Maximum age of a cache entry in seconds
+        """
+        self.db_path = db_path
+        self.max_age = max_age
+        self.conn = None
+        self.logger = get_logger(self.__class__.__name__)
+        # Lookups run on worker threads, so the connection is shared under a lock
+        self._lock = threading.Lock()
+        self._connect()
+        self._create_tables()
+        self._trim_http_cache()
+    
+    def _connect(self):
+        """Establish connection to the cache database."""
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        except sqlite3.Error as e:
+            log_error(f"Cache database connection error", e, self.__class__.__name__)
+            raise
+    
+    def _create_tables(self):
+        """Create cache tables if they don't exist."""
+        with self._lock:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS acoustid_cache (
+                    fp_hash TEXT PRIMARY KEY,
+                    artist TEXT,
+                    title TEXT,
+                    fetched_at INTEGER
+                )
+            ''')
+            
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS spotify_cache (
+                    key TEXT PRIMARY KEY,
+                    artist_id TEXT,
+                    fetched_at INTEGER
+                )
+            ''')
+            
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS cover_cache (
+                    key TEXT PRIMARY KEY,
+                    url TEXT,
+                    image BLOB,
+                    image_size TEXT,
+                    fetched_at INTEGER
+                )
+            ''')
+            
+            # Cache files from before thumbnails were stored lack the image columns
+            columns = [row[1] for row in self.conn.execute('PRAGMA table_info(cover_cache)')]
+            for column, column_type in (('image', 'BLOB'), ('image_size', 'TEXT')):
+                if column not in columns:
+                    self.conn.execute(f'ALTER TABLE cover_cache ADD COLUMN {column} {column_type}')
+            
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS fingerprint_cache (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER,
+                    mtime_ns INTEGER,
+                    duration REAL,
+                    fingerprint TEXT
+                )
+            ''')
+            
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS recommendation_cache (
+                    artist TEXT PRIMARY KEY,
+                    recommendations TEXT,
+                    fetched_at INTEGER
+                )
+            ''')
+            
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url_hash TEXT PRIMARY KEY,
+                    body BLOB,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at INTEGER
+                )
+            ''')
+            
+            self.conn.commit()
+    
+    def _trim_http_cache(self):
+        """Delete cached HTTP responses that went unused too long, then the oldest ones over the limit."""
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'DELETE FROM http_cache WHERE fetched_at < ?',
+                    (int(time.time()) - HTTP_CACHE_KEEP_AGE,)
+                )
+                self.conn.execute(
+                    '''
+                    DELETE FROM http_cache WHERE url_hash NOT IN (
+                        SELECT url_hash FROM http_cache ORDER BY fetched_at DESC LIMIT ?
+                    )
+                    ''',
+                    (HTTP_CACHE_MAX_ENTRIES,)
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error trimming HTTP cache", e, self.__class__.__name__)
+    
+    def _oldest_valid_timestamp(self) -> int:
+        """Get the oldest fetch time that is still considered fresh."""
+        return int(time.time()) - self.max_age
+    
+    @staticmethod
+    def _hash_fingerprint(fingerprint: str) -> str:
+        """Hash a fingerprint into a compact cache key."""
+        return hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _hash_url(url: str) -> str:
+        """Hash a request URL into a compact cache key."""
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _spotify_key(kind: str, artist_name: str, name: str) -> str:
+        """Build a Spotify cache key from an artist and an album or track name."""
+        return f"{kind}:{artist_name.lower()}:{name.lower()}"
+    
+    @staticmethod
+    def _cover_key(artist: str, track: str, size: str) -> str:
+        """Build an album art cache key from an artist, track and image size."""
+        return f"{artist.lower()}:{track.lower()}:{size}"
+    
+    @staticmethod
+    def _image_size_key(target_size: Tuple[int, int]) -> str:
+        """Describe a thumbnail target size, e.g. '500x500'."""
+        return f"{target_size[0]}x{target_size[1]}"
+    
+    def get_acoustid_metadata(self, fingerprint: str) -> Optional[Tuple[str, str]]:
+        """
+        Get cached (artist, title) for an audio fingerprint.
+        
+        Args:
+            fingerprint: Chromaprint fingerprint string
+            
+        Returns:
+            Tuple of (artist, title) or None if not cached
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT artist, title FROM acoustid_cache WHERE fp_hash = ? AND fetched_at >= ?',
+                    (self._hash_fingerprint(fingerprint), self._oldest_valid_timestamp())
+                ).fetchone()
+            return (row[0], row[1]) if row else None
+        except sqlite3.Error as e:
+            log_error(f"Error reading AcoustID cache", e, self.__class__.__name__)
+            return None
+    
+    def set_acoustid_metadata(self, fingerprint: str, artist: str, title: str):
+        """
+        Cache (artist, title) for an audio fingerprint.
+        
+        Args:
+            fingerprint: Chromaprint fingerprint string
+            artist: Artist name
+            title: Track title
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO acoustid_cache (fp_hash, artist, title, fetched_at) VALUES (?, ?, ?, ?)',
+                    (self._hash_fingerprint(fingerprint), artist, title, int(time.time()))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error writing AcoustID cache", e, self.__class__.__name__)
+    
+    def get_fingerprint(self, path: str, size: int, mtime_ns: int) -> Optional[Tuple[float, str]]:
+        """
+        Get a cached fingerprint for an unchanged audio file.
+        
+        Entries don't expire; a changed size or modification time invalidates them.
+        
+        Args:
+            path: Absolute path to the audio file
+            size: File size in bytes
+            mtime_ns: File modification time in nanoseconds
+            
+        Returns:
+            Tuple of (duration, fingerprint) or None if not cached
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT duration, fingerprint FROM fingerprint_cache WHERE path = ? AND size = ? AND mtime_ns = ?',
+                    (path, size, mtime_ns)
+                ).fetchone()
+            return (row[0], row[1]) if row else None
+        except sqlite3.Error as e:
+            log_error(f"Error reading fingerprint cache", e, self.__class__.__name__)
+            return None
+    
+    def set_fingerprint(self, path: str, size: int, mtime_ns: int, duration: float, fingerprint: str):
+        """
+        Cache the fingerprint of an audio file.
+        
+        Args:
+            path: Absolute path to the audio file
+            size: File size in bytes
+            mtime_ns: File modification time in nanoseconds
+            duration: Audio duration in seconds
+            fingerprint: Chromaprint fingerprint string
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO fingerprint_cache (path, size, mtime_ns, duration, fingerprint) VALUES (?, ?, ?, ?, ?)',
+                    (path, size, mtime_ns, duration, fingerprint)
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error writing fingerprint cache", e, self.__class__.__name__)
+    
+    def get_spotify_artist_id(self, kind: str, artist_name: str, name: str) -> Optional[str]:
+        """
+        Get a cached Spotify artist ID.
+        
+        Args:
+            kind: Search type the ID was found by ('album' or 'track')
+            artist_name: Artist name
+            name: Album or track name
+            
+        Returns:
+            Spotify artist ID or None if not cached
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT artist_id FROM spotify_cache WHERE key = ? AND fetched_at >= ?',
+                    (self._spotify_key(kind, artist_name, name), self._oldest_valid_timestamp())
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            log_error(f"Error reading Spotify cache", e, self.__class__.__name__)
+            return None
+    
+    def set_spotify_artist_id(self, kind: str, artist_name: str, name: str, artist_id: str):
+        """
+        Cache a Spotify artist ID.
+        
+        Args:
+            kind: Search type the ID was found by ('album' or 'track')
+            artist_name: Artist name
+            name: Album or track name
+            artist_id: Spotify artist ID
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO spotify_cache (key, artist_id, fetched_at) VALUES (?, ?, ?)',
+                    (self._spotify_key(kind, artist_name, name), artist_id, int(time.time()))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error writing Spotify cache", e, self.__class__.__name__)
+    
+    def get_album_art_url(self, artist: str, track: str, size: str) -> Optional[str]:
+        """
+        Get a cached album art URL.
+        
+        Args:
+            artist: Artist name
+            track: Track name
+            size: Image size the URL was looked up for
+            
+        Returns:
+            Album art URL or None if not cached
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT url FROM cover_cache WHERE key = ? AND fetched_at >= ?',
+                    (self._cover_key(artist, track, size), self._oldest_valid_timestamp())
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            log_error(f"Error reading album art cache", e, self.__class__.__name__)
+            return None
+    
+    def set_album_art_url(self, artist: str, track: str, size: str, url: str):
+        """
+        Cache an album art URL, keeping the stored thumbnail if the URL is unchanged.
+        
+        Args:
+            artist: Artist name
+            track: Track name
+            size: Image size the URL was looked up for
+            url: Album art URL
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    '''
+                    INSERT INTO cover_cache (key, url, fetched_at) VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET
+                        url = excluded.url,
+                        fetched_at = excluded.fetched_at,
+                        image = CASE WHEN cover_cache.url IS excluded.url THEN cover_cache.image END,
+                        image_size = CASE WHEN cover_cache.url IS excluded.url THEN cover_cache.image_size END
+                    ''',
+                    (self._cover_key(artist, track, size), url, int(time.time()))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error writing album art cache", e, self.__class__.__name__)
+    
+    def get_album_art_image(
+        self, artist: str, track: str, size: str, target_size: Tuple[int, int]
+    ) -> Optional[bytes]:
+        """
+        Get a cached, encoded album art thumbnail.
+        
+        Args:
+            artist: Artist name
+            track: Track name
+            size: Image size the URL was looked up for
+            target_size: Size the thumbnail was made for
+            
+        Returns:
+            Encoded image bytes or None if not cached for this target size
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT image FROM cover_cache WHERE key = ? AND image_size = ? AND fetched_at >= ?',
+                    (
+                        self._cover_key(artist, track, size),
+                        self._image_size_key(target_size),
+                        self._oldest_valid_timestamp()
+                    )
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            log_error(f"Error reading album art cache", e, self.__class__.__name__)
+            return None
+    
+    def set_album_art_image(
+        self, artist: str, track: str, size: str, target_size: Tuple[int, int], image: bytes
+    ):
+        """
+        Store an encoded album art thumbnail next to its cached URL.
+        
+        Args:
+            artist: Artist name
+            track: Track name
+            size: Image size the URL was looked up for
+            target_size: Size the thumbnail was made for
+            image: Encoded image bytes
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'UPDATE cover_cache SET image = ?, image_size = ? WHERE key = ?',
+                    (image, self._image_size_key(target_size), self._cover_key(artist, track, size))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error writing album art cache", e, self.__class__.__name__)
+    
+    def get_recommendations(self, artist: str, max_age: Optional[int] = None) -> Optional[List[Dict[str, str]]]:
+        """
+        Get cached Spotify recommendations for a seed artist.
+        
+        Args:
+            artist: Seed artist name
+            max_age: Maximum age of the entry in seconds, defaults to the cache's max age
+            
+        Returns:
+            List of recommendation dictionaries or None if not cached
+        """
+        oldest = int(time.time()) - max_age if max_age is not None else self._oldest_valid_timestamp()
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT recommendations FROM recommendation_cache WHERE artist = ? AND fetched_at >= ?',
+                    (artist, oldest)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            log_error(f"Error reading recommendation cache", e, self.__class__.__name__)
+            return None
+    
+    def set_recommendations(self, artist: str, recommendations: List[Dict[str, str]]):
+        """
+        Cache Spotify recommendations for a seed artist.
+        
+        Args:
+            artist: Seed artist name
+            recommendations: List of recommendation dictionaries
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO recommendation_cache (artist, recommendations, fetched_at) VALUES (?, ?, ?)',
+                    (artist, json.dumps(recommendations), int(time.time()))
+                )
+                self.conn.commit()
+        except (sqlite3.Error, TypeError) as e:
+            log_error(f"Error writing recommendation cache", e, self.__class__.__name__)
+    
+    def get_http_response(self, url: str) -> Optional[Tuple[bytes, Optional[str], Optional[str], int]]:
+        """
+        Get a cached HTTP response body and its validators.
+        
+        Stale entries are returned as well so they can be revalidated.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            Tuple of (body, etag, last_modified, fetched_at) or None if not cached
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    'SELECT body, etag, last_modified, fetched_at FROM http_cache WHERE url_hash = ?',
+                    (self._hash_url(url),)
+                ).fetchone()
+            return tuple(row) if row else None
+        except sqlite3.Error as e:
+            log_error(f"Error reading HTTP cache", e, self.__class__.__name__)
+            return None
+    
+    def set_http_response(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """
+        Cache an HTTP response body and its validators.
+        
+        Args:
+            url: Request URL
+            body: Raw response body
+            etag: ETag header of the response, if any
+            last_modified: Last-Modified header of the response, if any
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO http_cache (url_hash, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                    (self._hash_url(url), body, etag, last_modified, int(time.time()))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error writing HTTP cache", e, self.__class__.__name__)
+    
+    def touch_http_response(self, url: str):
+        """
+        Mark a cached HTTP response as fresh after the server confirmed it is unchanged.
+        
+        Args:
+            url: Request URL
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    'UPDATE http_cache SET fetched_at = ? WHERE url_hash = ?',
+                    (int(time.time()), self._hash_url(url))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            log_error(f"Error updating HTTP cache", e, self.__class__.__name__)
+    
+    def close(self):
+        """Close the cache database connection."""
+        if self.conn:
+            with self._lock:
+                self.conn.close()
+                self.conn = None
\ No newline at end of file
@@ -5,210 +5,553 @@ Handles all SQLite database operations for playlists and ratings.
 
 import sqlite3
 import os
+import shutil
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from typing import List, Tuple, Optional
 
-from ..utils.logging_utils import get_logger, log_error
+from ..utils.logging_utils import get_logger, log_error, log_warning
+
+# Number of compiled statements kept per connection
+CACHED_STATEMENTS = 128
+
+# Connection tuning for the working playlist database; WAL with NORMAL sync
+# only fsyncs at checkpoints instead of on every commit, and reads go
+# through a memory map rather than read() calls. A busy connection is
+# waited on for a few seconds instead of failing straight away
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=134217728',
+    'PRAGMA busy_timeout=5000',
+)
+
+# Seconds the writer thread waits after the first queued write, so writes
+# made in quick succession share one transaction
+WRITE_COALESCE_DELAY = 0.1
+
+# Statements used on hot paths, kept as constants so every call hits the statement cache.
+# Re-adding a path resets the row like REPLACE did, but unchanged rows are left
+# alone instead of being deleted and reinserted
+_SQL_UPSERT_SONG_SUFFIX = '''
+    ON CONFLICT(path) DO UPDATE SET
+        title = excluded.title,
+        duration = excluded.duration,
+        artist = excluded.artist,
+        year = excluded.year,
+        timesplayed = 0
+    WHERE playlist.title IS NOT excluded.title
+        OR playlist.duration IS NOT excluded.duration
+        OR playlist.artist IS NOT excluded.artist
+        OR playlist.year IS NOT excluded.year
+        OR playlist.timesplayed != 0
+'''
+# Multi-row insert used for bulk loads; SQLite builds before 3.32 allow at
+# most 999 bound parameters per statement, so rows are sent in chunks
+MAX_SQL_VARIABLES = 999
+_SONG_INSERT_COLUMNS = 5
+_SQL_INSERT_SONGS_PREFIX = '''
+    INSERT INTO playlist (title, duration, artist, year, path, timesplayed)
+    VALUES '''
+_SQL_SONG_ROW = '(?, ?, ?, ?, ?, 0)'
+
+# RETURNING lets one statement increment and read the counter (SQLite 3.35+)
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_INCREMENT_TIMES_PLAYED = '''
+    UPDATE playlist SET timesplayed = timesplayed + 1 WHERE path = ? RETURNING timesplayed
+'''
+_SQL_ADD_TIMES_PLAYED = 'UPDATE playlist SET timesplayed = timesplayed + 1 WHERE path = ?'
+_SQL_SELECT_TIMES_PLAYED = 'SELECT timesplayed FROM playlist WHERE path = ?'
+_SQL_SET_TIMES_PLAYED = 'UPDATE playlist SET timesplayed = ? WHERE path = ?'
+_SQL_UPDATE_SONG_METADATA = 'UPDATE playlist SET artist = ?, title = ? WHERE path = ?'
+
+# Every saved song, in the order the songs were added
+_SQL_SELECT_PLAYLIST_ROWS = 'SELECT title, duration, artist, year, path FROM playlist ORDER BY rowid'
+# Copies ratings from an attached playlist file for songs not rated here yet
+_SQL_MERGE_SAVED_RATINGS = '''
+    INSERT INTO rate (title, artist, rating)
+    SELECT title, artist, rating FROM saved.rate WHERE rating IS NOT NULL
+    ON CONFLICT(title, artist) DO UPDATE SET rating = excluded.rating
+    WHERE rate.rating IS NULL
+'''
+_SQL_SELECT_PATH_BY_ARTIST_TITLE = 'SELECT path FROM playlist WHERE artist = ? AND title = ?'
+# Adds an unrated entry; existing entries and their ratings are left untouched
+_SQL_KEEP_RATING = '''
+    INSERT INTO rate (title, artist, rating) VALUES (?, ?, NULL)
+    ON CONFLICT(title, artist) DO NOTHING
+'''
+# Same, but touches an existing entry so RETURNING hands back its rating
+_SQL_ENSURE_RATING = '''
+    INSERT INTO rate (title, artist, rating) VALUES (?, ?, NULL)
+    ON CONFLICT(title, artist) DO UPDATE SET rating = rating
+    RETURNING rating
+'''
+_SQL_SET_RATING = 'REPLACE INTO rate (title, artist, rating) VALUES (?, ?, ?)'
+_SQL_SELECT_RATING = 'SELECT rating FROM rate WHERE title = ? AND artist = ?'
+_SQL_UPDATE_RATING = 'UPDATE rate SET rating = ? WHERE title = ? AND artist = ?'
 
 
 class DatabaseManager:
     """Manages SQLite database operations for the music player."""
     
+    # Whether planner statistics are refreshed when the connection is closed
+    optimize_on_close = True
+    
     def __init__(self, db_path: str = 'playing.db'):
         self.db_path = db_path
         self.conn = None
         self.cursor = None
         self.logger = get_logger(self.__class__.__name__)
+        # The connection is shared under a lock so database work can run on worker
+        # threads; it is reentrant because some methods call others
+        self._lock = threading.RLock()
+        self._in_batch = False
+        self._init_write_queue()
         self._connect()
+        self._apply_pragmas()
         self._create_tables()
     
     def _connect(self):
         """Establish connection to the database."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+            )
             self.cursor = self.conn.cursor()
         except sqlite3.Error as e:
             log_error(f"Database connection error", e, self.__class__.__name__)
             raise
     
+    def _apply_pragmas(self):
+        """Tune the connection for frequent small writes."""
+        with self._lock:
+            try:
+                for pragma in CONNECTION_PRAGMAS:
+                    self.cursor.execute(pragma)
+            except sqlite3.Error as e:
+                # The defaults still work, just slower
+                log_error(f"Error applying database pragmas", e, self.__class__.__name__)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into one transaction, committed when the block exits.
+        
+        Methods called inside the block don't commit on their own, and the
+        whole batch is rolled back if the block raises. Nested batches join
+        the outer one.
+        """
+        with self._lock:
+            if self._in_batch:
+                yield
+                return
+            
+            self._in_batch = True
+            try:
+                with self.conn:
+                    yield
+            finally:
+                self._in_batch = False
+    
+    def _init_write_queue(self):
+        """Set up the queue of writes applied by the background writer thread."""
+        # (sql, params) pairs not yet executed, in the order they were made
+        self._pending_writes = deque()
+        self._writes_ready = threading.Event()
+        self._writer = None
+        self._writer_stopped = False
+    
+    def _queue_write(self, sql: str, params: Tuple):
+        """
+        Queue a write whose result the caller doesn't need, so it doesn't wait on the database.
+        
+        Args:
+            sql: Statement to execute
+            params: Parameters for the statement
+        """
+        self._pending_writes.append((sql, params))
+        
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._writer_loop, name='DatabaseWriter', daemon=True
+                    )
+                    self._writer.start()
+        
+        self._writes_ready.set()
+    
+    def _writer_loop(self):
+        """Apply queued writes in the background, several per transaction."""
+        while not self._writer_stopped:
+            self._writes_ready.wait()
+            time.sleep(WRITE_COALESCE_DELAY)
+            self._writes_ready.clear()
+            
+            with self._lock:
+                if not self._writer_stopped:
+                    self._apply_pending_writes()
+    
+    def _apply_pending_writes(self):
+        """Execute queued writes in one transaction; the caller holds the lock."""
+        if not self._pending_writes:
+            return
+        
+        try:
+            with self.batch():
+                while self._pending_writes:
+                    sql, params = self._pending_writes.popleft()
+                    try:
+                        self.cursor.execute(sql, params)
+                    except sqlite3.Error as e:
+                        log_error(f"Error applying queued write", e, self.__class__.__name__)
+        except sqlite3.Error as e:
+            log_error(f"Error committing queued writes", e, self.__class__.__name__)
+    
+    @contextmanager
+    def _synced(self):
+        """Hold the connection lock with all queued writes applied, so they are seen in order."""
+        with self._lock:
+            self._apply_pending_writes()
+            yield
+    
+    def _commit(self):
+        """Commit the current transaction unless a batch will commit it."""
+        if not self._in_batch:
+            self.conn.commit()
+    
+    def checkpoint(self):
+        """Write the WAL back into the main database file so it can be copied on its own."""
+        with self._synced():
+            try:
+                self.cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except sqlite3.Error as e:
+                log_error(f"Error checkpointing database", e, self.__class__.__name__)
+    
+    def backup(self, dest_path: str) -> bool:
+        """
+        Copy a consistent snapshot of the database to another file.
+        
+        Args:
+            dest_path: Path of the copy, replaced if it already exists
+            
+        Returns:
+            True if the copy was written
+        """
+        with self._synced():
+            try:
+                dest = sqlite3.connect(dest_path)
+                try:
+                    self.conn.backup(dest)
+                    # The copy keeps the WAL mode of the source; a standalone file
+                    # should open without needing -wal and -shm files beside it
+                    dest.execute('PRAGMA journal_mode=DELETE')
+                finally:
+                    dest.close()
+                return True
+            except sqlite3.Error as e:
+                # Happens when the destination exists but isn't a database;
+                # overwrite it with a file copy, as saving always did
+                log_warning(f"Backup to {dest_path} failed, copying the file instead: {e}", self.__class__.__name__)
+            
+            try:
+                # Nothing in this process writes while the lock is held, so a
+                # checkpointed file is complete; copyfile uses sendfile where available
+                self.cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                shutil.copyfile(self.db_path, dest_path)
+                
+                dest = sqlite3.connect(dest_path)
+                try:
+                    dest.execute('PRAGMA journal_mode=DELETE')
+                finally:
+                    dest.close()
+                return True
+            except (sqlite3.Error, OSError) as e:
+                log_error(f"Error backing up database", e, self.__class__.__name__)
+                return False
+    
     def _create_tables(self):
         """Create necessary tables if they don't exist."""
-        # Create playlist table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS playlist (
-                title VARCHAR(255),
-                duration VARCHAR(255),
-                artist VARCHAR(255),
-                year VARCHAR(255),
-                path VARCHAR(255) UNIQUE,
-                timesplayed INTEGER DEFAULT 0
-            )
-        ''')
-        
-        # Create rating table
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS rate (
-                title VARCHAR(255),
-                artist VARCHAR(255),
-                rating INTEGER,
-                UNIQUE(title, artist)
+        with self._synced():
+            # Create playlist table
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS playlist (
+                    title VARCHAR(255),
+                    duration VARCHAR(255),
+                    artist VARCHAR(255),
+                    year VARCHAR(255),
+                    path VARCHAR(255) UNIQUE,
+                    timesplayed INTEGER DEFAULT 0
+                )
+            ''')
+            
+            # Create rating table
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS rate (
+                    title VARCHAR(255),
+                    artist VARCHAR(255),
+                    rating INTEGER,
+                    UNIQUE(title, artist)
+                )
+            ''')
+            
+            # Index artist/title lookups on the playlist; path and (title, artist) on
+            # rate are already indexed by their UNIQUE constraints
+            self.cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_playlist_artist_title ON playlist (artist, title)'
             )
-        ''')
-        
-        self.conn.commit()
+            
+            self._commit()
     
     def clear_playlist(self):
         """Clear all songs from the current playlist."""
-        self.cursor.execute('DELETE FROM playlist')
-        self.conn.commit()
+        with self._synced():
+            self.cursor.execute('DELETE FROM playlist')
+            self._commit()
     
     def insert_song(self, title: str, duration: str, artist: str, year: str, path: str) -> bool:
         """Insert a new song into the playlist."""
-        try:
-            self.cursor.execute('''
-                REPLACE INTO playlist (title, duration, artist, year, path, timesplayed)
-                VALUES (?, ?, ?, ?, ?, 0)
-            ''', (title, duration, artist, year, path))
-            self.conn.commit()
-            return True
-        except sqlite3.Error as e:
-            log_error(f"Error inserting song", e, self.__class__.__name__)
-            return False
+        return self.insert_songs([(title, duration, artist, year, path)])
+    
+    def insert_songs(self, rows: List[Tuple[str, str, str, str, str]]) -> bool:
+        """Insert multiple songs into the playlist in a single transaction."""
+        with self._synced():
+            chunk_size = MAX_SQL_VARIABLES // _SONG_INSERT_COLUMNS
+            
+            try:
+                with self.batch():
+                    # One statement per chunk instead of one step per row
+                    for start in range(0, len(rows), chunk_size):
+                        chunk = rows[start:start + chunk_size]
+                        sql = (
+                            _SQL_INSERT_SONGS_PREFIX
+                            + ', '.join([_SQL_SONG_ROW] * len(chunk))
+                            + _SQL_UPSERT_SONG_SUFFIX
+                        )
+                        self.cursor.execute(sql, [value for row in chunk for value in row])
+                return True
+            except sqlite3.Error as e:
+                log_error(f"Error inserting songs", e, self.__class__.__name__)
+                return False
+    
+    def update_songs_metadata(self, rows: List[Tuple[str, str, str]]) -> bool:
+        """Update artist and title for multiple (artist, title, path) rows in a single transaction."""
+        with self._synced():
+            try:
+                with self.batch():
+                    self.cursor.executemany(_SQL_UPDATE_SONG_METADATA, rows)
+                return True
+            except sqlite3.Error as e:
+                log_error(f"Error updating song metadata", e, self.__class__.__name__)
+                return False
     
     def update_times_played(self, path: str) -> int:
         """Increment and return the times played counter for a song."""
-        try:
-            # Get current count
-            self.cursor.execute('SELECT timesplayed FROM playlist WHERE path = ?', (path,))
-            result = self.cursor.fetchone()
-            if result:
-                new_count = result[0] + 1
-                self.cursor.execute(
-                    'UPDATE playlist SET timesplayed = ? WHERE path = ?',
-                    (new_count, path)
-                )
-                self.conn.commit()
-                return new_count
-            return 0
-        except sqlite3.Error as e:
-            log_error(f"Error updating times played", e, self.__class__.__name__)
-            return 0
+        with self._synced():
+            try:
+                if HAS_RETURNING:
+                    self.cursor.execute(_SQL_INCREMENT_TIMES_PLAYED, (path,))
+                    result = self.cursor.fetchone()
+                    self._commit()
+                    return result[0] if result else 0
+                
+                # Get current count
+                self.cursor.execute(_SQL_SELECT_TIMES_PLAYED, (path,))
+                result = self.cursor.fetchone()
+                if result:
+                    new_count = result[0] + 1
+                    self.cursor.execute(_SQL_SET_TIMES_PLAYED, (new_count, path))
+                    self._commit()
+                    return new_count
+                return 0
+            except sqlite3.Error as e:
+                log_error(f"Error updating times played", e, self.__class__.__name__)
+                return 0
+    
+    def increment_times_played(self, path: str):
+        """Increment the times played counter for a song, in the background."""
+        self._queue_write(_SQL_ADD_TIMES_PLAYED, (path,))
     
     def get_song_by_artist_title(self, artist: str, title: str) -> Optional[Tuple]:
         """Get song information by artist and title."""
-        try:
-            self.cursor.execute(
-                'SELECT path FROM playlist WHERE artist = ? AND title = ?',
-                (artist, title)
-            )
-            return self.cursor.fetchone()
-        except sqlite3.Error as e:
-            log_error(f"Error getting song", e, self.__class__.__name__)
-            return None
+        with self._synced():
+            try:
+                self.cursor.execute(_SQL_SELECT_PATH_BY_ARTIST_TITLE, (artist, title))
+                return self.cursor.fetchone()
+            except sqlite3.Error as e:
+                log_error(f"Error getting song", e, self.__class__.__name__)
+                return None
     
     def get_times_played(self, path: str) -> int:
         """Get the times played count for a song."""
-        try:
-            self.cursor.execute('SELECT timesplayed FROM playlist WHERE path = ?', (path,))
-            result = self.cursor.fetchone()
-            return result[0] if result else 0
-        except sqlite3.Error as e:
-            log_error(f"Error getting times played", e, self.__class__.__name__)
-            return 0
+        with self._synced():
+            try:
+                self.cursor.execute(_SQL_SELECT_TIMES_PLAYED, (path,))
+                result = self.cursor.fetchone()
+                return result[0] if result else 0
+            except sqlite3.Error as e:
+                log_error(f"Error getting times played", e, self.__class__.__name__)
+                return 0
     
     def delete_song_by_path(self, path: str):
-        """Delete a song from the playlist by path."""
-        try:
-            self.cursor.execute('DELETE FROM playlist WHERE path = ?', (path,))
-            self.conn.commit()
-        except sqlite3.Error as e:
-            log_error(f"Error deleting song", e, self.__class__.__name__)
+        """Delete a song from the playlist by path, in the background."""
+        self._queue_write('DELETE FROM playlist WHERE path = ?', (path,))
     
     def delete_song_by_artist_title(self, artist: str, title: str):
-        """Delete a song from the playlist by artist and title."""
-        try:
-            self.cursor.execute(
-                'DELETE FROM playlist WHERE artist = ? AND title = ?',
-                (artist, title)
-            )
-            self.conn.commit()
-        except sqlite3.Error as e:
-            log_error(f"Error deleting song", e, self.__class__.__name__)
+        """Delete a song from the playlist by artist and title, in the background."""
+        self._queue_write('DELETE FROM playlist WHERE artist = ? AND title = ?', (artist, title))
     
     def update_song_path(self, old_path: str, new_path: str):
-        """Update the path of a song in the database."""
-        try:
-            self.cursor.execute(
-                'UPDATE playlist SET path = ? WHERE path = ?',
-                (new_path, old_path)
-            )
-            self.conn.commit()
-        except sqlite3.Error as e:
-            log_error(f"Error updating song path", e, self.__class__.__name__)
+        """Update the path of a song in the database, in the background."""
+        self._queue_write('UPDATE playlist SET path = ? WHERE path = ?', (new_path, old_path))
     
     def insert_or_update_rating(self, title: str, artist: str, rating: int = None):
         """Insert or update a song rating."""
-        try:
-            if rating is not None:
-                self.cursor.execute('''
-                    REPLACE INTO rate (title, artist, rating)
-                    VALUES (?, ?, ?)
-                ''', (title, artist, rating))
-            else:
-                # Insert with existing rating if available
-                self.cursor.execute('''
-                    REPLACE INTO rate (title, artist, rating)
-                    VALUES (?, ?, (SELECT rating FROM rate WHERE title = ? AND artist = ?))
-                ''', (title, artist, title, artist))
-            self.conn.commit()
-        except sqlite3.Error as e:
-            log_error(f"Error inserting/updating rating", e, self.__class__.__name__)
+        with self._synced():
+            try:
+                if rating is not None:
+                    self.cursor.execute(_SQL_SET_RATING, (title, artist, rating))
+                else:
+                    # Insert with existing rating if available
+                    self.cursor.execute(_SQL_KEEP_RATING, (title, artist))
+                self._commit()
+            except sqlite3.Error as e:
+                log_error(f"Error inserting/updating rating", e, self.__class__.__name__)
+    
+    def insert_ratings(self, songs: List[Tuple[str, str]]) -> List[int]:
+        """
+        Add rating entries for multiple (title, artist) pairs in a single transaction, keeping existing ratings.
+        
+        Args:
+            songs: List of (title, artist) pairs
+            
+        Returns:
+            Rating of each pair in the same order, 0 where unrated
+        """
+        with self._synced():
+            try:
+                ratings = []
+                with self.batch():
+                    for song in songs:
+                        if HAS_RETURNING:
+                            self.cursor.execute(_SQL_ENSURE_RATING, song)
+                        else:
+                            self.cursor.execute(_SQL_KEEP_RATING, song)
+                            self.cursor.execute(_SQL_SELECT_RATING, song)
+                        result = self.cursor.fetchone()
+                        ratings.append(result[0] if result and result[0] is not None else 0)
+                return ratings
+            except sqlite3.Error as e:
+                log_error(f"Error inserting ratings", e, self.__class__.__name__)
+                return [0] * len(songs)
     
     def get_rating(self, title: str, artist: str) -> Optional[int]:
         """Get the rating for a song."""
-        try:
-            self.cursor.execute(
-                'SELECT rating FROM rate WHERE title = ? AND artist = ?',
-                (title, artist)
-            )
-            result = self.cursor.fetchone()
-            return result[0] if result and result[0] is not None else 0
-        except sqlite3.Error as e:
-            log_error(f"Error getting rating", e, self.__class__.__name__)
-            return 0
+        with self._synced():
+            try:
+                self.cursor.execute(_SQL_SELECT_RATING, (title, artist))
+                result = self.cursor.fetchone()
+                return result[0] if result and result[0] is not None else 0
+            except sqlite3.Error as e:
+                log_error(f"Error getting rating", e, self.__class__.__name__)
+                return 0
     
     def update_rating(self, title: str, artist: str, rating: int):
-        """Update the rating for a song."""
-        try:
-            self.cursor.execute(
-                'UPDATE rate SET rating = ? WHERE title = ? AND artist = ?',
-                (rating, title, artist)
-            )
-            self.conn.commit()
-        except sqlite3.Error as e:
-            log_error(f"Error updating rating", e, self.__class__.__name__)
+        """Update the rating for a song, in the background."""
+        self._queue_write(_SQL_UPDATE_RATING, (rating, title, artist))
     
     def get_all_playlist_paths(self) -> List[str]:
         """Get all file paths from the current playlist."""
-        try:
-            self.cursor.execute('SELECT path FROM playlist')
-            return [row[0] for row in self.cursor.fetchall()]
-        except sqlite3.Error as e:
-            log_error(f"Error getting playlist paths", e, self.__class__.__name__)
-            return []
+        with self._synced():
+            try:
+                self.cursor.execute('SELECT path FROM playlist')
+                return [row[0] for row in self.cursor.fetchall()]
+            except sqlite3.Error as e:
+                log_error(f"Error getting playlist paths", e, self.__class__.__name__)
+                return []
+    
+    def merge_saved_ratings(self, playlist_path: str):
+        """
+        Copy ratings from a saved playlist file for songs that have no rating here.
+        
+        The file is attached to this connection, so the rows are copied inside
+        SQLite in a single statement.
+        
+        Args:
+            playlist_path: Path to the saved playlist database
+        """
+        with self._synced():
+            try:
+                self.cursor.execute('ATTACH DATABASE ? AS saved', (playlist_path,))
+            except sqlite3.Error as e:
+                log_error(f"Error attaching saved playlist", e, self.__class__.__name__)
+                return
+            
+            try:
+                self.cursor.execute(_SQL_MERGE_SAVED_RATINGS)
+                self._commit()
+            except sqlite3.Error as e:
+                log_error(f"Error merging saved ratings", e, self.__class__.__name__)
+                # An open transaction keeps the file locked, so DETACH would fail
+                if not self._in_batch:
+                    self.conn.rollback()
+            
+            try:
+                self.cursor.execute('DETACH DATABASE saved')
+            except sqlite3.Error as e:
+                log_error(f"Error detaching saved playlist", e, self.__class__.__name__)
+    
+    def get_all_playlist_rows(self) -> List[Tuple]:
+        """
+        Get every song in the playlist with its stored metadata.
+        
+        Returns:
+            List of (title, duration, artist, year, path) tuples
+        """
+        with self._synced():
+            try:
+                self.cursor.execute(_SQL_SELECT_PLAYLIST_ROWS)
+                return self.cursor.fetchall()
+            except sqlite3.Error as e:
+                log_error(f"Error getting playlist rows", e, self.__class__.__name__)
+                return []
     
     def close(self):
-        """Close the database connection."""
-        if self.conn:
-            self.conn.close()
+        """Close the database connection, applying queued writes first."""
+        self._writer_stopped = True
+        self._writes_ready.set()
+        
+        with self._synced():
+            if self.conn:
+                if self.optimize_on_close:
+                    self._optimize()
+                self.conn.close()
+    
+    def _optimize(self):
+        """Refresh query planner statistics for tables whose contents changed enough to need it."""
+        try:
+            self.cursor.execute('PRAGMA optimize')
+        except sqlite3.Error as e:
+            log_error(f"Error optimizing database", e, self.__class__.__name__)
 
 
 class PlaylistDatabaseManager(DatabaseManager):
     """Specialized database manager for saved playlist files."""
     
+    # Saved playlists are only read, so don't write statistics into them
+    optimize_on_close = False
+    
     def __init__(self, playlist_path: str):
         # Don't call parent __init__ as we want different behavior
         self.db_path = playlist_path
         self.conn = None
         self.cursor = None
+        self._lock = threading.RLock()
+        self._in_batch = False
+        self._init_write_queue()
         self._connect()
         # Note: We don't create tables here as we're reading existing playlists
\ No newline at end of file
@@ -3,16 +3,32 @@ Media player module for SMF Player.
 Encapsulates wx.media.MediaCtrl and provides a clean interface for media playback.
 """
 
+import time
 import wx
 import wx.media
 from typing import Optional, Callable
 
 from ..utils.logging_utils import get_logger, log_error, log_warning
 
+# Position polling interval: never shorter than the minimum, and long enough that
+# Tell() takes at most 1/POLL_COST_FACTOR of it on slow backends
+MIN_POLL_INTERVAL_MS = 250
+POLL_COST_FACTOR = 3
+POLL_SMOOTHING = 0.2
+
 
 class MediaPlayer:
     """Wrapper around wx.media.MediaCtrl with additional functionality."""
     
+    __slots__ = (
+        'parent', 'media_ctrl', 'current_file', 'volume', 'is_playing', 'is_paused',
+        '_length', '_poll_ns_ewma', '_loaded', '_play_when_loaded',
+        'on_media_finished', 'on_media_loaded'
+    )
+    
+    # Shared by all instances
+    logger = get_logger('MediaPlayer')
+    
     def __init__(self, parent: wx.Window):
         """
         Initialize the media player.
@@ -26,10 +42,22 @@ class MediaPlayer:
         self.volume = 1.0
         self.is_playing = False
         self.is_paused = False
-        self.logger = get_logger(self.__class__.__name__)
+        
+        # Length of the loaded media in ms; it is fixed once known, so the
+        # backend is only asked until it reports one
+        self._length = 0
+        
+        # Smoothed duration of a Tell() call in nanoseconds
+        self._poll_ns_ewma = 0.0
+        
+        # Some backends load in the background; playback requested before the
+        # media is ready starts from EVT_MEDIA_LOADED instead
+        self._loaded = False
+        self._play_when_loaded = False
         
         # Callbacks
         self.on_media_finished = None
+        self.on_media_loaded = None
         
         self._create_media_ctrl()
     
@@ -38,10 +66,36 @@ class MediaPlayer:
         try:
             self.media_ctrl = wx.media.MediaCtrl(self.parent, style=wx.SIMPLE_BORDER)
             self.media_ctrl.SetVolume(self.volume)
+            self.media_ctrl.Bind(wx.media.EVT_MEDIA_LOADED, self._on_media_loaded)
+            self.media_ctrl.Bind(wx.media.EVT_MEDIA_FINISHED, self._on_media_finished)
         except NotImplementedError:
             log_error("Media control not supported on this platform", None, self.__class__.__name__)
             raise RuntimeError("Media control not supported on this platform")
     
+    def _on_media_loaded(self, event):
+        """Remember the media length and start playback that was waiting for the load."""
+        self._loaded = True
+        self._length = max(self._length, self.media_ctrl.Length())
+        
+        if self._play_when_loaded:
+            self._play_when_loaded = False
+            if not self.media_ctrl.Play():
+                self.is_playing = False
+        
+        if self.on_media_loaded:
+            self.on_media_loaded(self._length)
+        event.Skip()
+    
+    def _on_media_finished(self, event):
+        """Update the state at the end of the media and notify the finished callback."""
+        self.is_playing = False
+        self.is_paused = False
+        
+        # Run the callback after the event, so it can load the next media safely
+        if self.on_media_finished:
+            wx.CallAfter(self.on_media_finished)
+        event.Skip()
+    
     def load_file(self, file_path: str) -> bool:
         """
         Load a media file.
@@ -56,6 +110,7 @@ class MediaPlayer:
             return False
         
         try:
+            self._reset_load_state()
             success = self.media_ctrl.Load(file_path)
             if success:
                 self.current_file = file_path
@@ -80,6 +135,7 @@ class MediaPlayer:
             return False
         
         try:
+            self._reset_load_state()
             success = self.media_ctrl.LoadURI(uri)
             if success:
                 self.current_file = uri
@@ -90,18 +146,29 @@ class MediaPlayer:
             log_error(f"Error loading URI {uri}", e, self.__class__.__name__)
             return False
     
+    def _reset_load_state(self):
+        """Forget the length and pending playback of the previous media."""
+        self._length = 0
+        self._loaded = False
+        self._play_when_loaded = False
+    
     def play(self) -> bool:
         """
         Start or resume playback.
         
+        If the media is still loading, playback starts once it has loaded.
+        
         Returns:
-            True if playback started successfully
+            True if playback started or is waiting for the load to finish
         """
         if not self.media_ctrl or not self.current_file:
             return False
         
         try:
             success = self.media_ctrl.Play()
+            if not success and not self._loaded:
+                self._play_when_loaded = True
+                success = True
             if success:
                 self.is_playing = True
                 self.is_paused = False
@@ -112,6 +179,7 @@ class MediaPlayer:
     
     def pause(self):
         """Pause playback."""
+        self._play_when_loaded = False
         if self.media_ctrl and self.is_playing:
             try:
                 self.media_ctrl.Pause()
@@ -123,6 +191,7 @@ class MediaPlayer:
     def stop(self):
         """Stop playback."""
         if self.media_ctrl:
+            self._play_when_loaded = False
             try:
                 self.media_ctrl.Stop()
                 self.is_playing = False
@@ -157,6 +226,28 @@ class MediaPlayer:
                 log_error(f"Error getting position", e, self.__class__.__name__)
         return 0
     
+    def poll_position(self) -> int:
+        """
+        Get the current playback position, timing the backend call.
+        
+        Returns:
+            Current position in milliseconds
+        """
+        start = time.perf_counter_ns()
+        position = self.get_position()
+        elapsed = time.perf_counter_ns() - start
+        self._poll_ns_ewma += POLL_SMOOTHING * (elapsed - self._poll_ns_ewma)
+        return position
+    
+    def recommended_poll_ms(self) -> int:
+        """
+        Get the polling interval that keeps position queries from swamping the UI.
+        
+        Returns:
+            Interval in milliseconds
+        """
+        return max(MIN_POLL_INTERVAL_MS, int(self._poll_ns_ewma / 1e6 * POLL_COST_FACTOR))
+    
     def get_length(self) -> int:
         """
         Get total length of current media.
@@ -164,9 +255,13 @@ class MediaPlayer:
         Returns:
             Total length in milliseconds
         """
+        if self._length:
+            return self._length
+        
         if self.media_ctrl:
             try:
-                return self.media_ctrl.Length()
+                self._length = self.media_ctrl.Length()
+                return self._length
             except Exception as e:
                 log_error(f"Error getting length", e, self.__class__.__name__)
         return 0
@@ -208,10 +303,16 @@ class MediaPlayer:
         else:
             return 'stopped'
     
-    def is_at_end(self) -> bool:
+    def is_at_end(self, position: Optional[int] = None) -> bool:
         """
         Check if playback has reached the end.
         
+        The finished callback reports the end without polling; this remains
+        for callers that need to check on demand.
+        
+        Args:
+            position: Current position in milliseconds, if the caller already has it
+            
         Returns:
             True if at end of media
         """
@@ -219,7 +320,8 @@ class MediaPlayer:
             return False
         
         try:
-            position = self.get_position()
+            if position is None:
+                position = self.get_position()
             length = self.get_length()
             return position >= length and length > 0
         except Exception as e:
@@ -235,6 +337,15 @@ class MediaPlayer:
         """
         self.on_media_finished = callback
     
+    def set_media_loaded_callback(self, callback: Callable):
+        """
+        Set callback for when media has loaded enough to play.
+        
+        Args:
+            callback: Function called with the media length in milliseconds
+        """
+        self.on_media_loaded = callback
+    
     def cleanup(self):
         """Clean up resources."""
         self.stop()
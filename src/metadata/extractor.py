@@ -5,22 +5,78 @@ Handles extraction of metadata from audio files using mutagen and ID3.
 
 import os
 import re
+import hashlib
 import wave
+import struct
+import threading
 import contextlib
-from typing import Dict, Optional
-from mutagen.id3 import ID3
-from mutagen import File as MutaFile
+import importlib
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from ..utils.logging_utils import get_logger, log_error
+from ..config import SUPPORTED_AUDIO_EXTENSIONS
+from ..utils.logging_utils import get_logger, log_error, log_warning
+
+# Maximum number of workers reading tags during bulk loads
+METADATA_WORKERS = 8
+
+# Tag parsing is pure Python and holds the GIL, so from this many files on
+# worker processes outrun threads despite their start-up cost
+PROCESS_POOL_THRESHOLD = 64
+
+# Number of files whose metadata, or embedded album art, is kept in memory.
+# Entries are keyed by (path, mtime_ns, size), so a changed file is read again
+METADATA_CACHE_SIZE = 4096
+ALBUM_ART_CACHE_SIZE = 16
+
+# Supported extensions without the dot, for a single set lookup per file
+SUPPORTED_EXTENSION_SET = frozenset(
+    extension.lstrip('.').lower() for extension in SUPPORTED_AUDIO_EXTENSIONS
+)
+
+# Mutagen parsers for each extension, so files skip the format probing in
+# mutagen.File; files that don't match their extension still go through it
+EXTENSION_PARSERS = {
+    'mp3': ('mutagen.mp3', 'MP3'),
+    'flac': ('mutagen.flac', 'FLAC'),
+    'ogg': ('mutagen.oggvorbis', 'OggVorbis'),
+    'wav': ('mutagen.wave', 'WAVE'),
+    'aac': ('mutagen.aac', 'AAC'),
+}
+
+# Characters after which artist and title tags only carry extras such as features
+TAG_SEPARATOR = re.compile(r'[,\(\)\?]')
+
+# Preformatted ':SS' suffixes for duration strings
+SECONDS_SUFFIXES = tuple(f":{second:02d}" for second in range(60))
+
+_metadata_cache = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+# Distinct embedded covers by content hash; tracks of one album share a cover,
+# so their cache entries point at a single bytes object
+_album_art_pool = OrderedDict()
+_album_art_pool_lock = threading.Lock()
+
+# Worker processes for bulk tag reads, started on first use and kept for later loads
+_process_pool = None
+_process_pool_lock = threading.Lock()
 
 
 class MetadataExtractor:
     """Extracts metadata from audio files."""
     
+    # Only static methods; never instantiated with state
+    __slots__ = ()
+    
     @staticmethod
     def extract_metadata(file_path: str) -> Dict[str, str]:
         """
-        Extract metadata from an audio file.
+        Extract metadata from an audio file, reusing the result while the file is unchanged.
         
         Args:
             file_path: Path to the audio file
@@ -28,81 +84,406 @@ class MetadataExtractor:
         Returns:
             Dictionary containing metadata: title, artist, duration, year
         """
-        metadata = {
-            'title': 'n/a',
-            'artist': '',
-            'duration': '0:00',
-            'year': ''
-        }
+        key = MetadataExtractor._cache_key(file_path)
+        if key is not None:
+            cached = MetadataExtractor._get_cached_metadata(key)
+            if cached is not None:
+                return dict(cached)
         
-        # Get backup name from filename
-        backup_name = os.path.splitext(os.path.basename(file_path))[0]
-        metadata['title'] = backup_name
+        metadata = MetadataExtractor._read_metadata(file_path)
+        if key is not None:
+            MetadataExtractor._store_cached_metadata(key, metadata)
+        return metadata
+    
+    @staticmethod
+    def _read_metadata(file_path: str, errors: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Read metadata from an audio file.
+        
+        Args:
+            file_path: Path to the audio file
+            errors: List collecting error messages instead of logging them, if given
+            
+        Returns:
+            Dictionary containing metadata: title, artist, duration, year
+        """
+        metadata = MetadataExtractor._default_metadata(file_path)
+        
+        # Imported on first use to keep it off the startup path
+        from mutagen import MutagenError
+        
+        # Parse the file once; stream info and tags come from the same object
+        try:
+            song = MetadataExtractor._open_audio(file_path)
+        except (MutagenError, OSError) as e:
+            MetadataExtractor._report_error(errors, f"Could not read {file_path}", e)
+            song = None
         
         # Get duration
-        duration_seconds = MetadataExtractor._get_duration(file_path)
+        duration_seconds = MetadataExtractor._get_duration(file_path, song)
         metadata['duration'] = MetadataExtractor._format_duration(duration_seconds)
         
+        audio = getattr(song, 'tags', None)
+        if song is None and file_path.lower().endswith('.mp3'):
+            # A damaged audio stream can make the MP3 parser give up on a file
+            # whose ID3 tag is intact, so read the tag on its own
+            audio = MetadataExtractor._read_id3_tags(file_path)
+        if audio is None:
+            return metadata
+        
         # Try to extract ID3 tags
         try:
-            audio = ID3(file_path)
+            artist = MetadataExtractor._first_frame_text(audio, 'TPE1')
+            title = MetadataExtractor._first_frame_text(audio, 'TIT2')
+            year = MetadataExtractor._first_frame_text(audio, 'TDRC')
             
             # Extract artist
-            if 'TPE1' in audio:
-                artist = audio['TPE1'].text[0]
+            if artist is not None:
                 # Clean artist name (remove features, parentheses, etc.)
-                artist = re.split(r'[,\(\)\?]', artist)[0].strip()
-                metadata['artist'] = artist
+                metadata['artist'] = TAG_SEPARATOR.split(artist, maxsplit=1)[0].strip()
             
             # Extract title
-            if 'TIT2' in audio:
-                title = audio['TIT2'].text[0]
+            if title is not None:
                 # Clean title
-                title = re.split(r'[,\(\)\?]', title)[0].strip()
-                metadata['title'] = title
+                metadata['title'] = TAG_SEPARATOR.split(title, maxsplit=1)[0].strip()
             
             # Extract year
-            if 'TDRC' in audio:
-                metadata['year'] = str(audio['TDRC'].text[0])
+            if year is not None:
+                metadata['year'] = str(year)
                 
-        except Exception as e:
-            logger = get_logger("MetadataExtractor")
-            log_error(f"Could not extract ID3 tags from {file_path}", e, "MetadataExtractor")
+        except (AttributeError, TypeError) as e:
+            # Non-ID3 tag containers hold values without a text list
+            MetadataExtractor._report_error(errors, f"Could not extract ID3 tags from {file_path}", e)
             # Keep the backup values
         
         return metadata
     
     @staticmethod
-    def _get_duration(file_path: str) -> float:
+    def _read_id3_tags(file_path: str):
+        """
+        Read just the ID3 tag of a file.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            ID3 tag container, or None if the file has no readable tag
+        """
+        from mutagen import MutagenError
+        from mutagen.id3 import ID3
+        
+        try:
+            return ID3(file_path)
+        except (MutagenError, OSError):
+            return None
+    
+    @staticmethod
+    def _default_metadata(file_path: str) -> Dict[str, str]:
+        """Build the metadata used when a file has no readable tags, titled after the filename."""
+        metadata = {
+            'title': 'n/a',
+            'artist': '',
+            'duration': '0:00',
+            'year': ''
+        }
+        
+        # Get backup name from filename
+        backup_name = os.path.splitext(os.path.basename(file_path))[0]
+        metadata['title'] = backup_name
+        return metadata
+    
+    @staticmethod
+    def _read_metadata_safely(file_path: str, errors: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Read metadata for one file of a batch, so a single bad file can't fail the whole batch.
+        
+        Args:
+            file_path: Path to the audio file
+            errors: List collecting error messages instead of logging them, if given
+            
+        Returns:
+            Dictionary containing metadata, from the filename if reading failed unexpectedly
+        """
+        try:
+            return MetadataExtractor._read_metadata(file_path, errors)
+        except Exception as e:
+            MetadataExtractor._report_error(errors, f"Unexpected error reading {file_path}", e)
+            return MetadataExtractor._default_metadata(file_path)
+    
+    @staticmethod
+    def _report_error(errors: Optional[List[str]], message: str, exception: Exception):
+        """Log a read error, or collect it when a worker process reads the file."""
+        if errors is None:
+            log_error(message, exception, "MetadataExtractor")
+        else:
+            errors.append(f"{message}: {exception}")
+    
+    @staticmethod
+    def _read_metadata_in_worker(file_path: str) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Read metadata in a worker process, which has no logging set up.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Tuple of (metadata, error messages for the parent to log)
+        """
+        errors = []
+        return MetadataExtractor._read_metadata_safely(file_path, errors), errors
+    
+    @staticmethod
+    def _get_process_pool() -> ProcessPoolExecutor:
+        """Get the shared worker process pool, starting it on first use."""
+        global _process_pool
+        with _process_pool_lock:
+            if _process_pool is None:
+                # Spawned workers don't inherit the UI, the logging queue thread or held locks
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=min(METADATA_WORKERS, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return _process_pool
+    
+    @staticmethod
+    def shutdown():
+        """Stop the worker processes used for bulk tag reads, if they were started."""
+        MetadataExtractor._discard_process_pool()
+    
+    @staticmethod
+    def _discard_process_pool():
+        """Shut down the shared worker process pool so the next bulk load starts a fresh one."""
+        global _process_pool
+        with _process_pool_lock:
+            pool, _process_pool = _process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _open_audio(file_path: str):
+        """
+        Parse an audio file with the mutagen parser for its extension.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Parsed mutagen file object, or None if mutagen doesn't recognize the file
+        """
+        from mutagen import File as MutaFile, MutagenError
+        
+        parser = MetadataExtractor._get_parser(file_path.rpartition('.')[2].lower())
+        if parser is not None:
+            try:
+                return parser(file_path)
+            except MutagenError:
+                # Mislabelled files, e.g. Opus in a .ogg, fall through to format detection
+                pass
+        
+        return MutaFile(file_path)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_parser(extension: str):
+        """
+        Get the mutagen file class for an extension, importing its module on first use.
+        
+        Args:
+            extension: Lower-case file extension without the dot
+            
+        Returns:
+            Mutagen file class, or None if the extension has no dedicated parser
+        """
+        location = EXTENSION_PARSERS.get(extension)
+        if location is None:
+            return None
+        
+        module_name, class_name = location
+        try:
+            return getattr(importlib.import_module(module_name), class_name)
+        except (ImportError, AttributeError):
+            # Older mutagen releases lack some parsers, e.g. WAVE before 1.45
+            return None
+    
+    @staticmethod
+    def _cache_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Build the cache key for a file.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Tuple of (path, mtime_ns, size), or None if the file can't be stat'ed
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return file_path, stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _get_cached_metadata(key: Tuple[str, int, int]) -> Optional[MappingProxyType]:
+        """Get cached metadata for a file, marking it as recently used."""
+        with _metadata_cache_lock:
+            metadata = _metadata_cache.get(key)
+            if metadata is not None:
+                _metadata_cache.move_to_end(key)
+            return metadata
+    
+    @staticmethod
+    def _store_cached_metadata(key: Tuple[str, int, int], metadata: Dict[str, str]):
+        """Cache a read-only copy of a file's metadata, evicting the least recently used entry."""
+        with _metadata_cache_lock:
+            _metadata_cache[key] = MappingProxyType(dict(metadata))
+            _metadata_cache.move_to_end(key)
+            if len(_metadata_cache) > METADATA_CACHE_SIZE:
+                _metadata_cache.popitem(last=False)
+    
+    @staticmethod
+    def extract_metadata_batch(file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Extract metadata from many audio files in parallel.
+        
+        Args:
+            file_paths: Paths to the audio files
+            
+        Returns:
+            List of metadata dictionaries in the same order as file_paths
+        """
+        results = [None] * len(file_paths)
+        keys = [MetadataExtractor._cache_key(file_path) for file_path in file_paths]
+        
+        # Cached files skip the pool; only the rest are parsed
+        missing = []
+        for index, key in enumerate(keys):
+            cached = MetadataExtractor._get_cached_metadata(key) if key is not None else None
+            if cached is not None:
+                results[index] = dict(cached)
+            else:
+                missing.append(index)
+        
+        paths = [file_paths[index] for index in missing]
+        for index, metadata in zip(missing, MetadataExtractor._read_metadata_batch(paths)):
+            results[index] = metadata
+            if keys[index] is not None:
+                MetadataExtractor._store_cached_metadata(keys[index], metadata)
+        
+        return results
+    
+    @staticmethod
+    def _read_metadata_batch(file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Read metadata from many audio files, in worker processes or threads when it pays off.
+        
+        Args:
+            file_paths: Paths to the audio files
+            
+        Returns:
+            List of metadata dictionaries in the same order as file_paths
+        """
+        if len(file_paths) >= PROCESS_POOL_THRESHOLD:
+            try:
+                results = list(MetadataExtractor._get_process_pool().map(
+                    MetadataExtractor._read_metadata_in_worker, file_paths, chunksize=16
+                ))
+            except Exception as e:
+                # Any pool failure, e.g. a worker that died or failed to start, falls back to threads
+                log_warning(f"Process pool unavailable, reading tags with threads: {e}", "MetadataExtractor")
+                MetadataExtractor._discard_process_pool()
+            else:
+                metadata_list = []
+                for metadata, errors in results:
+                    for message in errors:
+                        log_error(message, None, "MetadataExtractor")
+                    metadata_list.append(metadata)
+                return metadata_list
+        
+        if len(file_paths) > 1:
+            # Small batches are dominated by file I/O, which threads overlap well
+            workers = min(METADATA_WORKERS, len(file_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(MetadataExtractor._read_metadata_safely, file_paths))
+        
+        return [MetadataExtractor._read_metadata_safely(file_path) for file_path in file_paths]
+    
+    @staticmethod
+    def _first_frame_text(tags, frame_id: str):
+        """
+        Get the first text value of an ID3 frame.
+        
+        Args:
+            tags: Parsed tag container
+            frame_id: ID3 frame identifier (e.g. 'TPE1')
+            
+        Returns:
+            First text value, or None if the frame is missing or empty
+        """
+        frame = tags.get(frame_id)
+        if frame is None or not frame.text:
+            return None
+        return frame.text[0]
+    
+    @staticmethod
+    def _get_duration(file_path: str, song=None) -> float:
         """
         Get the duration of an audio file in seconds.
         
         Args:
             file_path: Path to the audio file
+            song: Already parsed mutagen file object, if available
             
         Returns:
             Duration in seconds
         """
-        try:
-            # Try using mutagen first
-            song = MutaFile(file_path)
-            if song and hasattr(song, 'info') and hasattr(song.info, 'length'):
-                return float(song.info.length)
-        except Exception:
-            pass
+        # Try using mutagen first
+        if song is not None and hasattr(song, 'info') and hasattr(song.info, 'length'):
+            return float(song.info.length)
         
         # Fallback for WAV files
         if file_path.lower().endswith('.wav'):
+            duration = MetadataExtractor._get_canonical_wav_duration(file_path)
+            if duration is not None:
+                return duration
+            
             try:
                 with contextlib.closing(wave.open(file_path, 'r')) as wav_file:
                     frames = wav_file.getnframes()
                     rate = wav_file.getframerate()
                     return frames / float(rate)
-            except Exception as e:
+            except (wave.Error, EOFError, OSError, ZeroDivisionError) as e:
                 log_error(f"Could not get WAV duration for {file_path}", e, "MetadataExtractor")
         
         return 0.0
     
+    @staticmethod
+    def _get_canonical_wav_duration(file_path: str) -> Optional[float]:
+        """
+        Get the duration of a WAV file from its 44-byte header.
+        
+        Only works for the canonical layout with the fmt chunk directly
+        followed by the data chunk; other layouts need the wave module.
+        
+        Args:
+            file_path: Path to the WAV file
+            
+        Returns:
+            Duration in seconds, or None if the header isn't canonical
+        """
+        try:
+            with open(file_path, 'rb') as wav_file:
+                header = wav_file.read(44)
+        except OSError:
+            return None
+        
+        if len(header) < 44 or header[:4] != b'RIFF' or header[8:12] != b'WAVE' \
+                or header[12:16] != b'fmt ' or header[36:40] != b'data':
+            return None
+        
+        byte_rate = struct.unpack_from('<I', header, 28)[0]
+        data_size = struct.unpack_from('<I', header, 40)[0]
+        return data_size / byte_rate if byte_rate else 0.0
+    
     @staticmethod
     def _format_duration(seconds: float) -> str:
         """
@@ -117,14 +498,13 @@ class MetadataExtractor:
         if seconds <= 0:
             return "0:00"
         
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes}:{seconds:02d}"
+        minutes, seconds = divmod(int(seconds), 60)
+        return str(minutes) + SECONDS_SUFFIXES[seconds]
     
     @staticmethod
     def get_embedded_album_art(file_path: str) -> Optional[bytes]:
         """
-        Extract embedded album art from an audio file.
+        Extract embedded album art from an audio file, reusing the result while the file is unchanged.
         
         Args:
             file_path: Path to the audio file
@@ -132,15 +512,103 @@ class MetadataExtractor:
         Returns:
             Album art data as bytes, or None if not found
         """
+        key = MetadataExtractor._cache_key(file_path)
+        if key is None:
+            return MetadataExtractor._read_embedded_album_art(file_path)
+        return MetadataExtractor._get_cached_album_art(*key)
+    
+    @staticmethod
+    @lru_cache(maxsize=ALBUM_ART_CACHE_SIZE)
+    def _get_cached_album_art(file_path: str, mtime_ns: int, size: int) -> Optional[bytes]:
+        """Read embedded album art; the modification time and size only make up the cache key."""
+        data = MetadataExtractor._read_embedded_album_art(file_path)
+        return MetadataExtractor._intern_album_art(data) if data else data
+    
+    @staticmethod
+    def _intern_album_art(data: bytes) -> bytes:
+        """
+        Return the pooled copy of an album cover, adding it if it's new.
+        
+        Bytes objects can't be weakly referenced, so the pool is a small LRU
+        the same size as the per-file art cache.
+        
+        Args:
+            data: Album art bytes
+            
+        Returns:
+            Bytes object with the same content, shared with other tracks
+        """
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        with _album_art_pool_lock:
+            pooled = _album_art_pool.get(key)
+            if pooled is not None:
+                _album_art_pool.move_to_end(key)
+                return pooled
+            
+            _album_art_pool[key] = data
+            if len(_album_art_pool) > ALBUM_ART_CACHE_SIZE:
+                _album_art_pool.popitem(last=False)
+            return data
+    
+    @staticmethod
+    def _read_embedded_album_art(file_path: str) -> Optional[bytes]:
+        """
+        Read embedded album art from an audio file.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Album art data as bytes, or None if not found
+        """
+        from mutagen import MutagenError
+        from mutagen.id3 import ID3, ID3NoHeaderError
+        
         try:
-            tags = ID3(file_path)
-            if "APIC:" in tags:
-                return tags.get("APIC:").data
-        except Exception as e:
+            # Frames are only read, so skip upgrading the tag to ID3v2.4 on load;
+            # untranslated ID3v2.2 tags keep the picture under its old frame ID
+            tags = ID3(file_path, translate=False)
+            frame = tags.get("APIC:") or tags.get("PIC:")
+            if frame is not None:
+                return frame.data
+        except ID3NoHeaderError:
+            # Untagged files are common and not an error; %s defers formatting
+            get_logger("MetadataExtractor").debug("No ID3 tag in %s", file_path)
+        except (MutagenError, OSError) as e:
             log_error(f"Could not extract album art from {file_path}", e, "MetadataExtractor")
         
         return None
     
+    @staticmethod
+    def scan_folder(folder_path: str) -> Iterator[str]:
+        """
+        Find supported audio files in a folder and its subfolders.
+        
+        Directory entries report their type from the listing itself,
+        so files are found without a stat call each.
+        
+        Args:
+            folder_path: Folder to scan
+            
+        Yields:
+            Paths of supported audio files
+        """
+        folders = [folder_path]
+        while folders:
+            subfolders = []
+            try:
+                with os.scandir(folders.pop()) as scan:
+                    for entry in scan:
+                        if entry.is_dir(follow_symlinks=False):
+                            subfolders.append(entry.path)
+                        elif entry.is_file() and MetadataExtractor.is_supported_audio_file(entry.name):
+                            yield entry.path
+            except OSError as e:
+                log_warning(f"Could not scan folder: {e}", "MetadataExtractor")
+            
+            # Visit subfolders in listing order, like os.walk
+            folders.extend(reversed(subfolders))
+    
     @staticmethod
     def is_supported_audio_file(file_path: str) -> bool:
         """
@@ -152,5 +620,5 @@ class MetadataExtractor:
         Returns:
             True if the file is a supported audio format
         """
-        from ..config import SUPPORTED_AUDIO_EXTENSIONS
-        return file_path.lower().endswith(SUPPORTED_AUDIO_EXTENSIONS)
\ No newline at end of file
+        _, dot, extension = file_path.rpartition('.')
+        return bool(dot) and extension.lower() in SUPPORTED_EXTENSION_SET
\ No newline at end of file
@@ -4,10 +4,14 @@ Handles playlist operations including loading, saving, filtering, and managing s
 """
 
 import os
+import threading
 import wx
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
-from shutil import copyfile
 
+from ..config import RECOMMENDATIONS_CACHE_MAX_AGE
+from ..database.cache import CacheManager
 from ..database.manager import DatabaseManager, PlaylistDatabaseManager
 from ..metadata.extractor import MetadataExtractor
 from ..api.acoustid_api import AcoustIDAPI
@@ -16,20 +20,46 @@ from ..api.spotify_api import SpotifyAPI
 from ..utils.image_processor import ImageProcessor
 from ..utils.logging_utils import get_logger, log_error, log_warning, log_info
 
+# Maximum number of concurrent AcoustID lookups while enriching a loaded batch;
+# the API client's per-host rate limit still applies across all of them
+ENRICH_WORKERS = 8
+
+# Number of seed artists whose recommendations are kept for the session
+RECOMMENDATIONS_CACHE_SIZE = 64
+
 
 class PlaylistManager:
     """Manages playlist operations and song data."""
     
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, cache: Optional[CacheManager] = None):
         """
         Initialize playlist manager.
         
         Args:
             db_manager: Database manager instance
+            cache: Optional cache that keeps recommendations between sessions
         """
         self.db_manager = db_manager
-        self.current_playlist = []  # List of song dictionaries
-        self.recommendations = []  # List of recommendation lists
+        self.cache = cache
+        self.current_playlist = []  # List of song dictionaries shown by the filter
+        self._all_songs = []  # Every song in the playlist, filtered out or not
+        # Recommendation lists by seed artist, least recently used first; filled
+        # from worker threads, so access goes through the lock
+        self.recommendations = OrderedDict()
+        self._recommendations_lock = threading.Lock()
+        # Playlist index of the first shown song with each (artist, title), and
+        # the (artist, title) of every song, shown or not, for duplicate checks
+        self._song_index = {}
+        self._all_song_keys = set()
+        # Filter applied by filter_playlist as (type, lowercase value); empty shows all
+        self._filter = ('', '')
+        # Paths of the audio files seen in loaded folders by file name; used
+        # to find moved files without walking the folder again. Folders are read
+        # on worker threads, so access goes through the lock
+        self._filename_index = {}
+        self._filename_index_lock = threading.Lock()
+        # Set when the player closes, so background lookups stop early
+        self._closing = threading.Event()
         self.logger = get_logger(self.__class__.__name__)
         
         # API clients (will be set by main frame)
@@ -43,10 +73,19 @@ class PlaylistManager:
         self.lastfm_api = lastfm_api
         self.spotify_api = spotify_api
     
+    def cancel_background_work(self):
+        """Make running enrichment and recommendation lookups return without their remaining API calls."""
+        self._closing.set()
+    
     def clear_playlist(self):
         """Clear the current playlist."""
         self.current_playlist.clear()
-        self.recommendations.clear()
+        self._all_songs.clear()
+        self._song_index.clear()
+        self._all_song_keys.clear()
+        self._filter = ('', '')
+        with self._recommendations_lock:
+            self.recommendations.clear()
         self.db_manager.clear_playlist()
     
     def add_song_from_file(self, file_path: str) -> Optional[Dict[str, str]]:
@@ -59,92 +98,180 @@ class PlaylistManager:
         Returns:
             Song dictionary or None if failed
         """
+        songs = self._add_songs([file_path])
+        return songs[0] if songs else None
+    
+    def load_folder(self, folder_path: str) -> List[Dict[str, str]]:
+        """
+        Load all supported audio files from a folder.
+        
+        Args:
+            folder_path: Path to the folder
+            
+        Returns:
+            List of loaded song dictionaries
+        """
+        return self.add_read_songs(self.read_folder(folder_path))
+    
+    def read_folder(self, folder_path: str) -> List[Dict[str, str]]:
+        """
+        Read the supported audio files in a folder without adding them to the playlist.
+        
+        Only touches the file system, so it can run on a worker thread.
+        
+        Args:
+            folder_path: Path to the folder
+            
+        Returns:
+            List of song dictionaries to pass to add_read_songs
+        """
+        file_paths = list(MetadataExtractor.scan_folder(folder_path))
+        self._index_file_names(file_paths)
+        
+        # The scan only lists existing files and the extensions were already checked
+        return self._read_songs(file_paths, checked=True)
+    
+    def load_files(self, file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Load multiple files into the playlist.
+        
+        Args:
+            file_paths: List of file paths
+            
+        Returns:
+            List of loaded song dictionaries
+        """
+        return self._add_songs(file_paths)
+    
+    def _is_loadable_file(self, file_path: str) -> bool:
+        """
+        Check that a file exists and is a supported audio format.
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            True if the file can be added to the playlist
+        """
         if not os.path.isfile(file_path):
             log_warning(f"File not found: {file_path}", self.__class__.__name__)
-            return None
+            return False
         
         if not MetadataExtractor.is_supported_audio_file(file_path):
             log_warning(f"Unsupported file format: {file_path}", self.__class__.__name__)
-            return None
-        
-        # Extract metadata
-        metadata = MetadataExtractor.extract_metadata(file_path)
+            return False
         
-        # Check if song already exists in playlist
-        if self._song_exists_in_playlist(metadata['artist'], metadata['title']):
-            log_info(f"Song already in playlist: {metadata['artist']} - {metadata['title']}", self.__class__.__name__)
-            return None
+        return True
+    
+    def _create_song(self, file_path: str, metadata: Dict[str, str]) -> Dict[str, str]:
+        """
+        Build a song dictionary from extracted metadata without touching the database.
         
-        # Create song dictionary
-        song = {
+        Args:
+            file_path: Path to the audio file
+            metadata: Metadata extracted from the file
+            
+        Returns:
+            Song dictionary
+        """
+        return {
             'title': metadata['title'],
             'artist': metadata['artist'],
             'duration': metadata['duration'],
             'year': metadata['year'],
             'path': file_path,
             'times_played': 0,
-            'rating': 0
+            'rating': 0,
+            # Lower-cased once here so filtering is a plain comparison
+            'artist_lower': metadata['artist'].lower(),
+            'title_lower': metadata['title'].lower()
         }
+    
+    def _add_songs(self, file_paths: List[str]) -> List[Dict[str, str]]:
+        """
+        Add songs to the playlist, inserting them into the database in one batch.
         
-        # Add to database
-        success = self.db_manager.insert_song(
-            song['title'], song['duration'], song['artist'], 
-            song['year'], song['path']
-        )
-        
-        if success:
-            # Get rating from database
-            song['rating'] = self.db_manager.get_rating(song['title'], song['artist'])
-            
-            # Add rating entry if it doesn't exist
-            self.db_manager.insert_or_update_rating(song['title'], song['artist'])
+        Args:
+            file_paths: List of file paths
             
-            # Add to current playlist
-            self.current_playlist.append(song)
-            return song
-        
-        return None
+        Returns:
+            List of added song dictionaries
+        """
+        return self.add_read_songs(self._read_songs(file_paths))
     
-    def load_folder(self, folder_path: str) -> List[Dict[str, str]]:
+    def _read_songs(self, file_paths: List[str], checked: bool = False) -> List[Dict[str, str]]:
         """
-        Load all supported audio files from a folder.
+        Build song dictionaries for audio files, reading all tags in one parallel batch.
         
         Args:
-            folder_path: Path to the folder
+            file_paths: List of file paths
+            checked: Whether the caller already knows the files exist and are supported
             
         Returns:
-            List of loaded song dictionaries
+            List of song dictionaries
         """
-        loaded_songs = []
+        if not checked:
+            file_paths = [file_path for file_path in file_paths if self._is_loadable_file(file_path)]
         
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if MetadataExtractor.is_supported_audio_file(file):
-                    file_path = os.path.join(root, file)
-                    song = self.add_song_from_file(file_path)
-                    if song:
-                        loaded_songs.append(song)
-        
-        return loaded_songs
+        return [
+            self._create_song(file_path, metadata)
+            for file_path, metadata in zip(file_paths, MetadataExtractor.extract_metadata_batch(file_paths))
+        ]
     
-    def load_files(self, file_paths: List[str]) -> List[Dict[str, str]]:
+    def add_read_songs(self, candidates: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
-        Load multiple files into the playlist.
+        Add songs built by read_folder to the playlist, skipping ones already in it.
         
         Args:
-            file_paths: List of file paths
+            candidates: Song dictionaries to add
             
         Returns:
-            List of loaded song dictionaries
+            List of added song dictionaries
         """
-        loaded_songs = []
+        songs = []
+        pending = set()
+        
+        for song in candidates:
+            # Check if song already exists in playlist or earlier in this batch
+            key = (song['artist'], song['title'])
+            if key in pending or self._song_exists_in_playlist(*key):
+                log_info(f"Song already in playlist: {song['artist']} - {song['title']}", self.__class__.__name__)
+                continue
+            
+            pending.add(key)
+            songs.append(song)
         
-        for file_path in file_paths:
-            song = self.add_song_from_file(file_path)
-            if song:
-                loaded_songs.append(song)
+        if not songs:
+            return []
+        
+        # Songs and their rating entries are committed together
+        with self.db_manager.batch():
+            success = self.db_manager.insert_songs([
+                (song['title'], song['duration'], song['artist'], song['year'], song['path'])
+                for song in songs
+            ])
+            
+            if not success:
+                return []
+            
+            # Add rating entries that don't exist yet, getting back existing ratings
+            ratings = self.db_manager.insert_ratings([(song['title'], song['artist']) for song in songs])
+        
+        for song, rating in zip(songs, ratings):
+            song['rating'] = rating
         
-        return loaded_songs
+        # Add to current playlist
+        self._all_songs.extend(songs)
+        self._all_song_keys.update((song['artist'], song['title']) for song in songs)
+        if self._filter[1]:
+            # Only the new songs matching the filter are shown, after the shown ones
+            self._apply_filter()
+        else:
+            start = len(self.current_playlist)
+            self.current_playlist.extend(songs)
+            for index, song in enumerate(songs, start):
+                self._song_index.setdefault((song['artist'], song['title']), index)
+        return songs
     
     def save_playlist(self, save_path: str) -> bool:
         """
@@ -161,9 +288,11 @@ class PlaylistManager:
             if not save_path.endswith('.db'):
                 save_path += '.db'
             
-            # Copy current database to save location
-            copyfile(self.db_manager.db_path, save_path)
-            return True
+            # Copy current database to save location through the backup API,
+            # which reads a consistent snapshot including commits still in
+            # the WAL; checkpointing first keeps the WAL from growing
+            self.db_manager.checkpoint()
+            return self.db_manager.backup(save_path)
             
         except Exception as e:
             log_error(f"Error saving playlist", e, self.__class__.__name__)
@@ -182,11 +311,28 @@ class PlaylistManager:
         try:
             # Create a temporary database manager for the playlist file
             playlist_db = PlaylistDatabaseManager(playlist_path)
-            file_paths = playlist_db.get_all_playlist_paths()
+            rows = playlist_db.get_all_playlist_rows()
             playlist_db.close()
             
-            # Load the files
-            return self.load_files(file_paths)
+            # Saved ratings are merged first so the songs pick them up when added
+            self.db_manager.merge_saved_ratings(playlist_path)
+            
+            # The saved rows already hold each song's tags, so files are only
+            # checked for existence instead of being parsed again
+            candidates = []
+            for title, duration, artist, year, path in rows:
+                if not self._is_loadable_file(path):
+                    continue
+                
+                metadata = {
+                    'title': title or '',
+                    'artist': artist or '',
+                    'duration': duration or '',
+                    'year': year or ''
+                }
+                candidates.append(self._create_song(path, metadata))
+            
+            return self.add_read_songs(candidates)
             
         except Exception as e:
             log_error(f"Error loading playlist", e, self.__class__.__name__)
@@ -205,10 +351,10 @@ class PlaylistManager:
         Returns:
             Tuple of (song_dict, index) or None if not found
         """
-        for i, song in enumerate(self.current_playlist):
-            if song['artist'] == artist and song['title'] == title:
-                return song, i
-        return None
+        index = self._song_index.get((artist, title))
+        if index is None:
+            return None
+        return self.current_playlist[index], index
     
     def update_times_played(self, song_index: int) -> int:
         """
@@ -222,9 +368,11 @@ class PlaylistManager:
         """
         if 0 <= song_index < len(self.current_playlist):
             song = self.current_playlist[song_index]
-            new_count = self.db_manager.update_times_played(song['path'])
-            song['times_played'] = new_count
-            return new_count
+            # The stored counter starts at 0 with the song, same as the one
+            # kept here, so the write doesn't need to report it back
+            song['times_played'] += 1
+            self.db_manager.increment_times_played(song['path'])
+            return song['times_played']
         return 0
     
     def update_song_rating(self, song_index: int, rating: int):
@@ -242,26 +390,36 @@ class PlaylistManager:
     
     def filter_playlist(self, filter_type: str, filter_value: str):
         """
-        Filter the current playlist by artist or title.
+        Show only the songs whose artist or title contains a value.
+        
+        The whole playlist is filtered each time, so a shorter value shows songs
+        hidden by a longer one again and an empty value shows every song.
         
         Args:
             filter_type: 'Artist' or 'Title'
-            filter_value: Value to filter by
+            filter_value: Text to look for, ignoring case
         """
-        if filter_type == 'Artist':
+        self._filter = (filter_type, filter_value.lower())
+        self._apply_filter()
+    
+    def _apply_filter(self):
+        """Rebuild the shown songs from the whole playlist using the current filter."""
+        filter_type, filter_value = self._filter
+        
+        if not filter_value:
+            self.current_playlist = list(self._all_songs)
+        elif filter_type == 'Artist':
             self.current_playlist = [
-                song for song in self.current_playlist 
-                if song['artist'].lower() == filter_value.lower()
+                song for song in self._all_songs
+                if filter_value in song['artist_lower']
             ]
         elif filter_type == 'Title':
             self.current_playlist = [
-                song for song in self.current_playlist 
-                if song['title'].lower() == filter_value.lower()
+                song for song in self._all_songs
+                if filter_value in song['title_lower']
             ]
         
-        # Update database to match filtered playlist
-        # Note: This is a destructive operation in the original code
-        # You might want to implement this differently
+        self._rebuild_song_index()
     
     def remove_song(self, song_index: int) -> bool:
         """
@@ -277,6 +435,10 @@ class PlaylistManager:
             song = self.current_playlist[song_index]
             self.db_manager.delete_song_by_path(song['path'])
             del self.current_playlist[song_index]
+            self._all_songs = [other for other in self._all_songs if other is not song]
+            # Every later song moved down one place
+            self._rebuild_song_index()
+            self._rebuild_song_keys()
             return True
         return False
     
@@ -297,6 +459,12 @@ class PlaylistManager:
             
             self.db_manager.update_song_path(old_path, new_path)
             song['path'] = new_path
+            
+            with self._filename_index_lock:
+                candidates = self._filename_index.get(os.path.basename(old_path))
+                if candidates and old_path in candidates:
+                    candidates.remove(old_path)
+            self._index_file_names([new_path])
             return True
         return False
     
@@ -321,13 +489,78 @@ class PlaylistManager:
         directory = path_parts[0]
         filename = path_parts[1]
         
+        # Files seen when their folder was loaded are checked first
+        prefix = os.path.join(directory, '')
+        with self._filename_index_lock:
+            candidates = list(self._filename_index.get(filename, ()))
+        for candidate in candidates:
+            if candidate != original_path and candidate.startswith(prefix) and os.path.isfile(candidate):
+                return candidate
+        
         # Search in subdirectories
-        for root, dirs, files in os.walk(directory):
-            if filename in files:
-                return os.path.join(root, filename)
+        new_path = self._search_tree(directory, filename)
+        if new_path is not None:
+            self._index_file_names([new_path])
+        return new_path
+    
+    @staticmethod
+    def _search_tree(directory: str, filename: str) -> Optional[str]:
+        """
+        Find a file by name in a folder and its subfolders, stopping at the first match.
+        
+        Folders are visited in the same order as os.walk, but directory entries
+        report their type from the listing, so no entry needs a stat call.
+        
+        Args:
+            directory: Folder to search
+            filename: Name of the file to find
+            
+        Returns:
+            Path of the first match or None if not found
+        """
+        folders = [directory]
+        while folders:
+            subfolders = []
+            try:
+                with os.scandir(folders.pop()) as scan:
+                    for entry in scan:
+                        if entry.is_dir(follow_symlinks=False):
+                            subfolders.append(entry.path)
+                        elif entry.name == filename and entry.is_file():
+                            return entry.path
+            except OSError:
+                continue
+            
+            folders.extend(reversed(subfolders))
         
         return None
     
+    def _index_file_names(self, file_paths: List[str]):
+        """
+        Record audio file paths under their file names for find_moved_file.
+        
+        Args:
+            file_paths: Paths of existing audio files
+        """
+        with self._filename_index_lock:
+            for file_path in file_paths:
+                paths = self._filename_index.setdefault(os.path.basename(file_path), [])
+                if file_path not in paths:
+                    paths.append(file_path)
+    
+    def is_known_file(self, file_path: str) -> bool:
+        """
+        Check whether a file was listed when its folder was loaded, without touching the disk.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            True if the file was seen in a loaded folder
+        """
+        with self._filename_index_lock:
+            return file_path in self._filename_index.get(os.path.basename(file_path), ())
+    
     def get_enhanced_metadata(self, song: Dict[str, str]) -> Dict[str, str]:
         """
         Get enhanced metadata using API services when basic metadata is missing.
@@ -352,6 +585,77 @@ class PlaylistManager:
         
         return enhanced_song
     
+    def enrich_songs(self, songs: List[Dict[str, str]]) -> List[Tuple[str, str, str]]:
+        """
+        Look up missing artist/title metadata for many songs concurrently.
+        
+        Only reads files and calls the API, so it is safe to run off the UI thread.
+        
+        Args:
+            songs: Song dictionaries, typically a freshly loaded batch
+            
+        Returns:
+            List of (path, artist, title) for songs that were identified
+        """
+        if not self.acoustid_api or not self.acoustid_api.is_configured():
+            return []
+        
+        paths = [song['path'] for song in songs if not song['artist']]
+        if not paths:
+            return []
+        
+        # Fingerprinting and lookups are bound by fpcalc and network round-trips
+        workers = min(ENRICH_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._identify_file, paths)
+            return [
+                (path, result[0], result[1])
+                for path, result in zip(paths, results)
+                if result
+            ]
+    
+    def _identify_file(self, file_path: str) -> Optional[Tuple[str, str]]:
+        """Look up a file's artist and title with AcoustID, unless the player is closing."""
+        if self._closing.is_set():
+            return None
+        return self.acoustid_api.get_metadata_from_file(file_path)
+    
+    def apply_enriched_metadata(self, results: List[Tuple[str, str, str]]) -> List[int]:
+        """
+        Store metadata found by enrich_songs in the playlist and database.
+        
+        Args:
+            results: List of (path, artist, title)
+            
+        Returns:
+            Playlist indexes of the songs that were updated
+        """
+        # Songs hidden by the filter are updated too, they just aren't redrawn
+        songs = {song['path']: song for song in self._all_songs}
+        updated = [(songs[path], artist, title) for path, artist, title in results if path in songs]
+        if not updated:
+            return []
+        
+        success = self.db_manager.update_songs_metadata([
+            (artist, title, song['path']) for song, artist, title in updated
+        ])
+        if not success:
+            return []
+        
+        ratings = self.db_manager.insert_ratings([(title, artist) for song, artist, title in updated])
+        
+        for (song, artist, title), rating in zip(updated, ratings):
+            song['artist'] = artist
+            song['title'] = title
+            song['artist_lower'] = artist.lower()
+            song['title_lower'] = title.lower()
+            song['rating'] = rating
+        
+        self._rebuild_song_index()
+        self._rebuild_song_keys()
+        changed = {id(song) for song, artist, title in updated}
+        return [index for index, song in enumerate(self.current_playlist) if id(song) in changed]
+    
     def get_recommendations(self, artist_name: str, track_name: str) -> List[Dict[str, str]]:
         """
         Get song recommendations for an artist/track.
@@ -367,41 +671,73 @@ class PlaylistManager:
             return []
         
         # Check if we already have recommendations for this artist
-        for rec_list in self.recommendations:
-            for rec in rec_list:
-                if rec.get('seed_artist_name') == artist_name:
-                    return rec_list
+        with self._recommendations_lock:
+            if artist_name in self.recommendations:
+                self.recommendations.move_to_end(artist_name)
+                return self.recommendations[artist_name]
+        
+        # Recommendations from an earlier session skip the Spotify searches
+        if self.cache is not None:
+            recommendations = self.cache.get_recommendations(artist_name, RECOMMENDATIONS_CACHE_MAX_AGE)
+            if recommendations:
+                self._store_recommendations(artist_name, recommendations)
+                return recommendations
         
         # Try album-based recommendations first
+        if self._closing.is_set():
+            return []
         try:
             recommendations = self.spotify_api.get_recommendations_by_album_artist(
                 track_name, artist_name
             )
             if recommendations:
-                self.recommendations.append(recommendations)
+                self._remember_recommendations(artist_name, recommendations)
                 return recommendations
         except Exception as e:
             log_error(f"Error getting album-based recommendations", e, self.__class__.__name__)
         
         # Fall back to track-based recommendations
+        if self._closing.is_set():
+            return []
         try:
             recommendations = self.spotify_api.get_recommendations_by_track_artist(
                 track_name, artist_name
             )
             if recommendations:
-                self.recommendations.append(recommendations)
+                self._remember_recommendations(artist_name, recommendations)
                 return recommendations
         except Exception as e:
             log_error(f"Error getting track-based recommendations", e, self.__class__.__name__)
         
         return []
     
+    def _store_recommendations(self, artist_name: str, recommendations: List[Dict[str, str]]):
+        """Keep recommendations for a seed artist, dropping the least recently used artist when full."""
+        with self._recommendations_lock:
+            self.recommendations[artist_name] = recommendations
+            self.recommendations.move_to_end(artist_name)
+            if len(self.recommendations) > RECOMMENDATIONS_CACHE_SIZE:
+                self.recommendations.popitem(last=False)
+    
+    def _remember_recommendations(self, artist_name: str, recommendations: List[Dict[str, str]]):
+        """Keep fresh recommendations for this session and, when there is a cache, later ones."""
+        self._store_recommendations(artist_name, recommendations)
+        if self.cache is not None:
+            self.cache.set_recommendations(artist_name, recommendations)
+    
     def _song_exists_in_playlist(self, artist: str, title: str) -> bool:
-        """Check if a song already exists in the current playlist."""
-        for song in self.current_playlist:
-            if song['artist'] == artist and song['title'] == title:
-                return True
-        return False
+        """Check if a song already exists in the playlist, including songs the filter hides."""
+        return (artist, title) in self._all_song_keys
+    
+    def _rebuild_song_keys(self):
+        """Rebuild the (artist, title) set of all songs after songs were removed or renamed."""
+        self._all_song_keys = {(song['artist'], song['title']) for song in self._all_songs}
+    
+    def _rebuild_song_index(self):
+        """Rebuild the (artist, title) index after songs were removed, reordered or renamed."""
+        self._song_index = {}
+        for index, song in enumerate(self.current_playlist):
+            self._song_index.setdefault((song['artist'], song['title']), index)
     
     def get_playlist_count(self) -> int:
         """Get the number of songs in the current playlist."""
@@ -6,19 +6,24 @@ Provides common dialog functionality to reduce code duplication.
 import wx
 from typing import Optional, List, Tuple
 
-from ..utils.logging_utils import get_logger, log_error
+from ..utils.logging_utils import log_error
 
 
 class DialogHelpers:
     """Helper class for common UI dialogs."""
     
+    # File dialogs kept alive for reuse, by id of the parent window and then by
+    # configuration; a parent's entry is dropped when the parent is destroyed
+    _file_dialogs = {}
+    
     @staticmethod
     def show_file_dialog(
         parent: wx.Window,
         title: str,
         wildcard: str,
         style: int = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST,
-        multiple: bool = False
+        multiple: bool = False,
+        reuse: bool = False
     ) -> Optional[List[str]]:
         """
         Show a file dialog and return selected file paths.
@@ -29,35 +34,97 @@ class DialogHelpers:
             wildcard: File type filter
             style: Dialog style flags
             multiple: Whether to allow multiple file selection
+            reuse: Keep the dialog alive and reuse it on the next call
             
         Returns:
             List of selected file paths, or None if cancelled
         """
-        logger = get_logger("DialogHelpers")
-        
         try:
             if multiple:
                 style |= wx.FD_MULTIPLE
             
+            if reuse and parent is not None:
+                dialog = DialogHelpers._get_reusable_file_dialog(parent, title, wildcard, style)
+                return DialogHelpers._show_open_file_dialog(dialog, multiple)
+            
             with wx.FileDialog(parent, title, wildcard=wildcard, style=style) as dialog:
-                if dialog.ShowModal() == wx.ID_CANCEL:
-                    return None
-                
-                if multiple:
-                    return dialog.GetPaths()
-                else:
-                    return [dialog.GetPath()]
+                return DialogHelpers._show_open_file_dialog(dialog, multiple)
                     
         except Exception as e:
             log_error(f"Error showing file dialog", e, "DialogHelpers")
             return None
     
+    @staticmethod
+    def _get_reusable_file_dialog(
+        parent: wx.Window,
+        title: str,
+        wildcard: str,
+        style: int
+    ) -> wx.FileDialog:
+        """
+        Get a cached file dialog, creating it on first use.
+        
+        Args:
+            parent: Parent window
+            title: Dialog title
+            wildcard: File type filter
+            style: Dialog style flags
+            
+        Returns:
+            File dialog owned by the parent window
+        """
+        parent_id = id(parent)
+        dialogs = DialogHelpers._file_dialogs.get(parent_id)
+        if dialogs is None:
+            # Window ids are reused once a window is gone, so forget its dialogs with it
+            dialogs = DialogHelpers._file_dialogs[parent_id] = {}
+            parent.Bind(
+                wx.EVT_WINDOW_DESTROY,
+                lambda event: DialogHelpers._forget_file_dialogs(event, parent, parent_id)
+            )
+        
+        key = (title, wildcard, style)
+        dialog = dialogs.get(key)
+        if not dialog:
+            dialog = wx.FileDialog(parent, title, wildcard=wildcard, style=style)
+            dialogs[key] = dialog
+        
+        return dialog
+    
+    @staticmethod
+    def _forget_file_dialogs(event: wx.WindowDestroyEvent, parent: wx.Window, parent_id: int):
+        """Drop the cached file dialogs of a parent window that is being destroyed."""
+        event.Skip()
+        if event.GetEventObject() is parent:
+            DialogHelpers._file_dialogs.pop(parent_id, None)
+    
+    @staticmethod
+    def _show_open_file_dialog(dialog: wx.FileDialog, multiple: bool) -> Optional[List[str]]:
+        """
+        Show a file dialog modally and collect the selection.
+        
+        Args:
+            dialog: File dialog to show
+            multiple: Whether multiple file selection is enabled
+            
+        Returns:
+            List of selected file paths, or None if cancelled
+        """
+        if dialog.ShowModal() == wx.ID_CANCEL:
+            return None
+        
+        if multiple:
+            return dialog.GetPaths()
+        else:
+            return [dialog.GetPath()]
+    
     @staticmethod
     def show_single_file_dialog(
         parent: wx.Window,
         title: str,
         wildcard: str,
-        style: int = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+        style: int = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST,
+        reuse: bool = False
     ) -> Optional[str]:
         """
         Show a file dialog for single file selection and return the file path.
@@ -67,11 +134,14 @@ class DialogHelpers:
             title: Dialog title
             wildcard: File type filter
             style: Dialog style flags
+            reuse: Keep the dialog alive and reuse it on the next call
             
         Returns:
             Selected file path, or None if cancelled
         """
-        result = DialogHelpers.show_file_dialog(parent, title, wildcard, style, multiple=False)
+        result = DialogHelpers.show_file_dialog(
+            parent, title, wildcard, style, multiple=False, reuse=reuse
+        )
         return result[0] if result else None
     
     @staticmethod
@@ -79,7 +149,8 @@ class DialogHelpers:
         parent: wx.Window,
         title: str,
         wildcard: str,
-        style: int = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+        style: int = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST,
+        reuse: bool = False
     ) -> Optional[List[str]]:
         """
         Show a file dialog for multiple file selection and return the file paths.
@@ -89,11 +160,14 @@ class DialogHelpers:
             title: Dialog title
             wildcard: File type filter
             style: Dialog style flags
+            reuse: Keep the dialog alive and reuse it on the next call
             
         Returns:
             List of selected file paths, or None if cancelled
         """
-        return DialogHelpers.show_file_dialog(parent, title, wildcard, style, multiple=True)
+        return DialogHelpers.show_file_dialog(
+            parent, title, wildcard, style, multiple=True, reuse=reuse
+        )
     
     @staticmethod
     def show_directory_dialog(
@@ -131,8 +205,6 @@ class DialogHelpers:
         Returns:
             Selected directory path, or None if cancelled
         """
-        logger = get_logger("DialogHelpers")
-        
         try:
             with wx.DirDialog(parent, title, style=style) as dialog:
                 if dialog.ShowModal() == wx.ID_CANCEL:
@@ -163,8 +235,6 @@ class DialogHelpers:
         Returns:
             Selected file path, or None if cancelled
         """
-        logger = get_logger("DialogHelpers")
-        
         try:
             with wx.FileDialog(
                 parent, 
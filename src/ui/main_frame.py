@@ -6,15 +6,20 @@ Refactored UI class that delegates business logic to specialized modules.
 import wx
 import wx.media
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
-from typing import Optional
+from typing import Callable, Optional
 
 from ..config import (
-    WINDOW_SIZE, WINDOW_POSITION, ALBUM_ART_SIZE, BUTTON_SIZE,
-    setup_spotify_environment, LASTFM_API_KEY, ACOUSTID_API_KEY,
-    SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET, DEFAULT_PLAYLIST_DB
+    WINDOW_SIZE, WINDOW_POSITION, ALBUM_ART_SIZE, BUTTON_SIZE, BUTTON_CACHE_DIR,
+    LASTFM_API_KEY, ACOUSTID_API_KEY,
+    SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET, DEFAULT_PLAYLIST_DB,
+    DEFAULT_CACHE_DB, CACHE_MAX_AGE
 )
 from ..database.manager import DatabaseManager
+from ..database.cache import CacheManager
 from ..media.player import MediaPlayer
 from ..playlist.manager import PlaylistManager
 from ..api.acoustid_api import AcoustIDAPI
@@ -24,11 +29,29 @@ from ..utils.image_processor import ImageProcessor
 from ..metadata.extractor import MetadataExtractor
 from ..utils.logging_utils import log_info, log_error, log_warning
 from .dialog_helpers import DialogHelpers
+from .playlist_list import PlaylistListCtrl
+
+# File dialog filters
+MUSIC_FILES_WILDCARD = "Music files (*.mp3,*.wav,*.aac,*.ogg,*.flac)|*.mp3;*.wav;*.aac;*.ogg;*.flac"
+PLAYLIST_FILES_WILDCARD = "Playlist files (*.db)|*.db"
+
+# Delay after the last keystroke before the playlist filter is applied, in ms
+FILTER_DELAY_MS = 150
+
+# Delay before recommendations are requested for a newly loaded song, in ms; songs
+# skipped past within it never reach Spotify
+RECOMMENDATIONS_DELAY_MS = 200
+
+# Number of album art bitmaps kept in memory, keyed by artist and title
+ALBUM_ART_MEMORY_CACHE_SIZE = 64
 
 
 class MainFrame(wx.Frame):
     """Main application frame with modular architecture."""
     
+    # Scaled button bitmaps shared by every frame instance
+    _button_bitmaps = {}
+    
     def __init__(self, parent, id):
         """Initialize the main frame."""
         # Window setup
@@ -55,33 +78,51 @@ class MainFrame(wx.Frame):
     
     def _initialize_components(self):
         """Initialize all core components and managers."""
-        # Set up Spotify environment
-        setup_spotify_environment()
-        
         # Initialize database manager
         self.db_manager = DatabaseManager(DEFAULT_PLAYLIST_DB)
         
+        # Initialize API lookup cache
+        self.cache_manager = CacheManager(DEFAULT_CACHE_DB, CACHE_MAX_AGE)
+        
         # Initialize media player
         self.media_player = MediaPlayer(self)
+        self.media_player.set_media_loaded_callback(self._on_media_loaded)
+        self.media_player.set_media_finished_callback(self._on_media_finished)
         
         # Initialize playlist manager
-        self.playlist_manager = PlaylistManager(self.db_manager)
+        self.playlist_manager = PlaylistManager(self.db_manager, self.cache_manager)
         
         # Initialize API clients
-        self.acoustid_api = AcoustIDAPI(ACOUSTID_API_KEY)
-        self.lastfm_api = LastFMAPI(LASTFM_API_KEY)
-        self.spotify_api = SpotifyAPI(SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET)
+        self.acoustid_api = AcoustIDAPI(ACOUSTID_API_KEY, self.cache_manager)
+        self.lastfm_api = LastFMAPI(LASTFM_API_KEY, self.cache_manager)
+        self.spotify_api = SpotifyAPI(
+            SPOTIPY_CLIENT_ID, SPOTIPY_CLIENT_SECRET, self.cache_manager
+        )
         
         # Set API clients in playlist manager
         self.playlist_manager.set_api_clients(
             self.acoustid_api, self.lastfm_api, self.spotify_api
         )
         
+        # Worker pool for blocking network and fingerprinting work
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="smf-io")
+        # Fetch the Spotify token while the user picks music
+        # Fetch the Spotify token and open its connection while the user picks music
+        if self.spotify_api.is_configured():
+            self._io_pool.submit(self.spotify_api.warm_up)
+        
         # UI state variables
         self.current_volume = 100
         self.count_add_to_playlist = 0
         self.current_song_index = -1
         self.repeat_mode = False
+        self._track_length = 0  # Length of the loaded media in ms, 0 if unknown
+        self._playlist_generation = 0  # Bumped whenever the playlist is replaced
+        self._recommendation_rows = []  # Recommendation shown on each list row
+        self._filter_call = None  # Pending wx.CallLater that applies the filter
+        self._prefetched = None  # (path, enhanced song) resolved ahead for the next song
+        self._recommendations_call = None  # Pending wx.CallLater that requests recommendations
+        self._art_cache = OrderedDict()  # (artist, title) -> album art bitmap, oldest first
     
     def _create_panels(self):
         """Create all UI panels."""
@@ -100,16 +141,11 @@ class MainFrame(wx.Frame):
         self.playlist_panel = wx.Panel(self, size=(600, 500))
         self.playlist_panel.SetBackgroundColour("SALMON")
         
-        # Create playlist list control
-        self.playlist_listctrl = wx.ListCtrl(
-            self.playlist_panel, size=(550, 425), pos=(25, 10), 
-            style=wx.LC_REPORT
+        # Create playlist list control; rows are read from the playlist as they are painted
+        self.playlist_listctrl = PlaylistListCtrl(
+            self.playlist_panel, self.playlist_manager.get_song_by_index,
+            size=(550, 425), pos=(25, 10)
         )
-        self.playlist_listctrl.AppendColumn("Artist", width=170)
-        self.playlist_listctrl.AppendColumn("Title", width=170)
-        self.playlist_listctrl.AppendColumn("Duration", width=70)
-        self.playlist_listctrl.AppendColumn("Counter", width=70)
-        self.playlist_listctrl.AppendColumn("Rating", width=70)
         self.playlist_listctrl.SetBackgroundColour("Black")
         self.playlist_listctrl.SetTextColour("White")
         self.playlist_listctrl.Bind(wx.EVT_LIST_ITEM_SELECTED, self._on_playlist_item_selected)
@@ -205,17 +241,10 @@ class MainFrame(wx.Frame):
         """Create playback and control buttons."""
         # Load button images
         try:
-            play_btn_img = wx.Bitmap("src/resources/play-button.png", wx.BITMAP_TYPE_ANY)
-            play_btn_img = ImageProcessor.scale_bitmap(play_btn_img, *BUTTON_SIZE)
-            
-            prev_btn_img = wx.Bitmap("src/resources/previous-song-button.png", wx.BITMAP_TYPE_ANY)
-            prev_btn_img = ImageProcessor.scale_bitmap(prev_btn_img, *BUTTON_SIZE)
-            
-            next_btn_img = wx.Bitmap("src/resources/next-song-button.png", wx.BITMAP_TYPE_ANY)
-            next_btn_img = ImageProcessor.scale_bitmap(next_btn_img, *BUTTON_SIZE)
-            
-            repeat_btn_img = wx.Bitmap("src/resources/repeat-button.png", wx.BITMAP_TYPE_ANY)
-            repeat_btn_img = ImageProcessor.scale_bitmap(repeat_btn_img, *BUTTON_SIZE)
+            play_btn_img = self._get_button_bitmap("play-button.png")
+            prev_btn_img = self._get_button_bitmap("previous-song-button.png")
+            next_btn_img = self._get_button_bitmap("next-song-button.png")
+            repeat_btn_img = self._get_button_bitmap("repeat-button.png")
         except Exception as e:
             log_error("Failed to load button images", e, "MainFrame")
             # Create default buttons without images
@@ -280,23 +309,125 @@ class MainFrame(wx.Frame):
         self.next_button.Bind(wx.EVT_BUTTON, self._on_next)
         self.repeat_button.Bind(wx.EVT_TOGGLEBUTTON, self._on_repeat)
         self.filter_button.Bind(wx.EVT_BUTTON, self._on_filter)
+        self.filter_text.Bind(wx.EVT_TEXT, self._on_filter_changed)
+        self.filter_combo.Bind(wx.EVT_COMBOBOX, self._on_filter_changed)
         self.rating_radiobox.Bind(wx.EVT_RADIOBOX, self._on_rating_change)
     
+    @classmethod
+    def _get_button_bitmap(cls, filename: str) -> wx.Bitmap:
+        """
+        Get a button image from the resources folder, scaled to BUTTON_SIZE.
+        
+        Args:
+            filename: Image file name inside src/resources
+            
+        Returns:
+            Scaled bitmap, decoded once per process
+        """
+        bitmap = cls._button_bitmaps.get(filename)
+        if bitmap is None:
+            bitmap = wx.Bitmap(cls._load_button_image(filename))
+            cls._button_bitmaps[filename] = bitmap
+        return bitmap
+    
+    @staticmethod
+    def _load_button_image(filename: str) -> wx.Image:
+        """
+        Load a button image scaled to BUTTON_SIZE, from the on-disk cache when possible.
+        
+        The cache holds the scaled RGB and alpha bytes, so later launches build the
+        image straight from them instead of decoding and resampling the PNG.
+        
+        Args:
+            filename: Image file name inside src/resources
+            
+        Returns:
+            Scaled image
+        """
+        source_path = f"src/resources/{filename}"
+        width, height = BUTTON_SIZE
+        pixels = width * height
+        
+        # The source's modification time is part of the name, so edited images are scaled again
+        try:
+            source_mtime = os.stat(source_path).st_mtime_ns
+        except OSError:
+            source_mtime = 0
+        cache_path = os.path.join(
+            BUTTON_CACHE_DIR,
+            f"{os.path.splitext(filename)[0]}_{width}x{height}_{source_mtime}.rgba"
+        )
+        
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                data = cache_file.read()
+            if len(data) == pixels * 4:
+                return wx.Image(width, height, data[:pixels * 3], data[pixels * 3:])
+        except OSError:
+            pass
+        
+        image = wx.Image(source_path, wx.BITMAP_TYPE_ANY).Scale(width, height, wx.IMAGE_QUALITY_HIGH)
+        if not image.HasAlpha():
+            image.InitAlpha()
+        
+        try:
+            os.makedirs(BUTTON_CACHE_DIR, exist_ok=True)
+            
+            # Write to a temporary file first so a partial file is never read back
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(bytes(image.GetData()))
+                cache_file.write(bytes(image.GetAlpha()))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            log_warning(f"Could not cache button image {filename}: {e}", "MainFrame")
+        
+        return image
+    
     def _setup_timer(self):
         """Set up the playback timer."""
         self.timer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self._on_timer)
-        self.timer.Start(50)  # Update every 50ms
+        
+        # One-shot, re-armed after each tick so slow backends get a longer interval
+        self.timer.StartOnce(self.media_player.recommended_poll_ms())
     
     # Event handlers
     def _on_close(self, event):
         """Handle window close event."""
         self.timer.Stop()
-        self.db_manager.close()
+        for call in (self._filter_call, self._recommendations_call):
+            if call is not None:
+                call.Stop()
+        # Queued tasks are dropped and running ones skip their remaining API calls;
+        # they may still write to the databases, so those are closed on another
+        # thread once the pool is idle, without holding up the window
+        self.playlist_manager.cancel_background_work()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.spotify_api.close()
+        MetadataExtractor.shutdown()
+        threading.Thread(
+            target=self._close_when_idle,
+            args=(self._io_pool, self.db_manager, self.cache_manager, self.lastfm_api),
+            name="smf-shutdown"
+        ).start()
         self.media_player.set_volume(1.0)
         self.media_player.cleanup()
         self.Destroy()
     
+    @staticmethod
+    def _close_when_idle(
+        io_pool: ThreadPoolExecutor,
+        db_manager: DatabaseManager,
+        cache_manager: CacheManager,
+        lastfm_api: LastFMAPI
+    ):
+        """Wait for running background tasks, then close the databases and connections."""
+        io_pool.shutdown(wait=True)
+        db_manager.close()
+        cache_manager.close()
+        lastfm_api.close_session()
+    
     def _on_menu_handler(self, action: str, event):
         """Handle menu item selections."""
         if action == 'open_folder':
@@ -328,13 +459,24 @@ class MainFrame(wx.Frame):
         self.playlist_manager.clear_playlist()
         self._clear_ui()
         
-        # Load folder
+        # Scanning and tag reading run in the background so the window stays responsive
+        self._submit_io(
+            partial(self._on_folder_read, self._playlist_generation),
+            self.playlist_manager.read_folder, folder_path
+        )
+    
+    def _on_folder_read(self, generation: int, songs: list):
+        """Add the songs read from a folder, unless another playlist was opened meanwhile."""
+        if generation != self._playlist_generation:
+            return
+        
         try:
-            loaded_songs = self.playlist_manager.load_folder(folder_path)
+            loaded_songs = self.playlist_manager.add_read_songs(songs)
             self._refresh_playlist_display()
             
             if loaded_songs:
                 self._select_first_song()
+                self._enrich_songs(loaded_songs)
                 log_info(f"Loaded {len(loaded_songs)} songs from folder", "MainFrame")
                 
         except Exception as e:
@@ -344,8 +486,7 @@ class MainFrame(wx.Frame):
     def _open_file(self):
         """Open a single music file."""
         file_path = DialogHelpers.show_single_file_dialog(
-            self, "Open Music file",
-            "Music files (*.mp3,*.wav,*.aac,*.ogg,*.flac)|*.mp3;*.wav;*.aac;*.ogg;*.flac"
+            self, "Open Music file", MUSIC_FILES_WILDCARD, reuse=True
         )
         if not file_path:
             return
@@ -372,8 +513,7 @@ class MainFrame(wx.Frame):
     def _add_to_playlist(self):
         """Add files to the current playlist."""
         file_paths = DialogHelpers.show_multiple_file_dialog(
-            self, "Add music file to playlist",
-            "Music files (*.mp3,*.wav,*.aac,*.ogg,*.flac)|*.mp3;*.wav;*.aac;*.ogg;*.flac"
+            self, "Add music file to playlist", MUSIC_FILES_WILDCARD, reuse=True
         )
         if not file_paths:
             return
@@ -382,7 +522,9 @@ class MainFrame(wx.Frame):
         
         try:
             loaded_songs = self.playlist_manager.load_files(file_paths)
-            self._refresh_playlist_display()
+            # Only the new rows need to be added; existing ones are unchanged
+            self._append_playlist_rows(loaded_songs)
+            self._enrich_songs(loaded_songs)
             
             # If this is the first song(s) added, select the first one
             if self.playlist_manager.get_playlist_count() == len(loaded_songs):
@@ -426,7 +568,7 @@ class MainFrame(wx.Frame):
     def _open_playlist(self):
         """Open a saved playlist."""
         playlist_path = DialogHelpers.show_single_file_dialog(
-            self, "Open playlist file", "Playlist files (*.db)|*.db"
+            self, "Open playlist file", PLAYLIST_FILES_WILDCARD, reuse=True
         )
         if not playlist_path:
             return
@@ -446,6 +588,7 @@ class MainFrame(wx.Frame):
                 self._select_first_song()
                 self._load_song_at_index(0)
                 self.count_add_to_playlist += 1
+                self._enrich_songs(loaded_songs)
                 log_info(f"Loaded {len(loaded_songs)} songs from playlist", "MainFrame")
             else:
                 log_warning("No songs found in playlist file", "MainFrame")
@@ -469,30 +612,18 @@ class MainFrame(wx.Frame):
     
     def _on_recommendation_selected(self, event):
         """Handle recommendation item selection."""
-        row = event.GetEventObject().GetFocusedItem()
+        row = event.GetIndex()
+        if not 0 <= row < len(self._recommendation_rows):
+            return
+        rec = self._recommendation_rows[row]
         
-        # Get recommendation data
-        cols = self.recommendations_listctrl.GetColumnCount()
-        data = []
-        for col in range(cols - 1):
-            item = self.recommendations_listctrl.GetItem(itemIdx=row, col=col)
-            data.append(item.GetText())
-        
-        artist_name = data[0]
-        song_title = data[1]
-        
-        # Find the recommendation in our stored data
-        recommendations = self.playlist_manager.recommendations
-        for rec_list in recommendations:
-            for rec in rec_list:
-                if rec['artist'] == artist_name and rec['title'] == song_title:
-                    # Load and play the preview
-                    if self.media_player.load_uri(rec['preview_url']):
-                        self.media_player.play()
-                        self.playback_slider.SetValue(0)
-                        self.playback_slider.SetRange(0, 30000)  # 30 second preview
-                        self.play_button.SetValue(True)
-                    return
+        # Load and play the preview
+        if self.media_player.load_uri(rec['preview_url']):
+            self.media_player.play()
+            self._track_length = 0
+            self.playback_slider.SetValue(0)
+            self.playback_slider.SetRange(0, 30000)  # 30 second preview
+            self.play_button.SetValue(True)
     
     def _on_play(self, event):
         """Handle play/pause button."""
@@ -504,8 +635,10 @@ class MainFrame(wx.Frame):
             self.play_button.SetValue(False)
             DialogHelpers.show_error_message(self, "A file must be selected.")
         else:
-            length = self.media_player.get_length()
-            self.playback_slider.SetRange(0, length)
+            # Some backends only know the length once playback starts
+            if not self._track_length:
+                self._track_length = self.media_player.get_length()
+            self.playback_slider.SetRange(0, self._track_length)
     
     def _on_previous(self, event):
         """Handle previous button."""
@@ -536,20 +669,39 @@ class MainFrame(wx.Frame):
         self.current_volume = self.volume_slider.GetValue()
         self.media_player.set_volume(self.current_volume / 100.0)
     
+    def _on_filter_changed(self, event):
+        """Filter the playlist shortly after the user stops typing."""
+        if self._filter_call is not None and self._filter_call.IsRunning():
+            self._filter_call.Restart(FILTER_DELAY_MS)
+        else:
+            self._filter_call = wx.CallLater(FILTER_DELAY_MS, self._apply_filter)
+    
     def _on_filter(self, event):
         """Handle filter button click."""
-        filter_text = self.filter_text.GetValue()
+        if self._filter_call is not None:
+            self._filter_call.Stop()
+        self._apply_filter()
+    
+    def _apply_filter(self):
+        """Show the songs matching the filter text, keeping the loaded song selected."""
         filter_selection = self.filter_combo.GetCurrentSelection()
-        
         if filter_selection == -1:
             return
         
         filter_type = self.filter_combo.GetString(filter_selection)
+        current_song = self.playlist_manager.get_song_by_index(self.current_song_index)
         
-        if filter_text:
-            self.playlist_manager.filter_playlist(filter_type, filter_text)
-            self._refresh_playlist_display()
-            self._clear_playback()
+        self.playlist_manager.filter_playlist(filter_type, self.filter_text.GetValue())
+        self._refresh_playlist_display()
+        
+        # Playback carries on; point the current index at the song's new row without
+        # selecting it, since a selection event would load the song again
+        if current_song is not None:
+            found = self.playlist_manager.get_song_by_artist_title(
+                current_song['artist'], current_song['title']
+            )
+            if found is not None and found[0] is current_song:
+                self.current_song_index = found[1]
     
     def _on_rating_change(self, event):
         """Handle rating change."""
@@ -558,26 +710,41 @@ class MainFrame(wx.Frame):
             self.playlist_manager.update_song_rating(self.current_song_index, rating)
             
             # Update the display
-            self.playlist_listctrl.SetItem(self.current_song_index, 4, str(rating))
+            self.playlist_listctrl.RefreshItem(self.current_song_index)
+    
+    def _on_media_loaded(self, length: int):
+        """Size the playback slider once the backend reports the media length."""
+        if length:
+            self._track_length = length
+            self.playback_slider.SetRange(0, length)
+    
+    def _on_media_finished(self):
+        """Repeat the song or move to the next one when playback reaches the end."""
+        if self.repeat_mode:
+            # Repeat current song
+            self._load_song_at_index(self.current_song_index)
+        else:
+            # Move to next song
+            self._on_next(None)
     
     def _on_timer(self, event):
         """Handle timer events for playback progress."""
-        if self.media_player.get_state() == 'playing':
-            position = self.media_player.get_position()
-            self.playback_slider.SetValue(position)
-            
-            # Check if song finished
-            if self.media_player.is_at_end():
-                if self.repeat_mode:
-                    # Repeat current song
-                    self._load_song_at_index(self.current_song_index)
-                else:
-                    # Move to next song
-                    self._on_next(None)
+        try:
+            if self.media_player.get_state() == 'playing':
+                # Each SetValue repaints the slider, so skip it when nothing moved
+                position = self.media_player.poll_position()
+                if position != self.playback_slider.GetValue():
+                    self.playback_slider.SetValue(position)
+        finally:
+            self.timer.StartOnce(self.media_player.recommended_poll_ms())
     
     # UI Helper Methods
     def _clear_ui(self):
         """Clear all UI displays."""
+        self._playlist_generation += 1
+        if self._filter_call is not None:
+            self._filter_call.Stop()
+        self.filter_text.ChangeValue('')
         self._clear_playback()
         self._clear_playlist_display()
         self._clear_recommendations_display()
@@ -591,12 +758,13 @@ class MainFrame(wx.Frame):
     
     def _clear_playlist_display(self):
         """Clear the playlist display."""
-        self.playlist_listctrl.DeleteAllItems()
+        self.playlist_listctrl.set_row_count(0)
         self.current_song_index = -1
     
     def _clear_recommendations_display(self):
         """Clear the recommendations display."""
         self.recommendations_listctrl.DeleteAllItems()
+        self._recommendation_rows = []
     
     def _clear_album_art(self):
         """Clear the album art display."""
@@ -607,14 +775,15 @@ class MainFrame(wx.Frame):
     def _refresh_playlist_display(self):
         """Refresh the playlist display with current data."""
         self._clear_playlist_display()
+        self.playlist_listctrl.set_row_count(self.playlist_manager.get_playlist_count())
+    
+    def _append_playlist_rows(self, songs: list):
+        """Show rows for songs appended to the end of the playlist."""
+        if not songs:
+            return
         
-        playlist = self.playlist_manager.get_playlist_copy()
-        for i, song in enumerate(playlist):
-            self.playlist_listctrl.InsertItem(i, song['artist'])
-            self.playlist_listctrl.SetItem(i, 1, song['title'])
-            self.playlist_listctrl.SetItem(i, 2, song['duration'])
-            self.playlist_listctrl.SetItem(i, 3, str(song['times_played']))
-            self.playlist_listctrl.SetItem(i, 4, str(song['rating']))
+        # The virtual list reads the new rows itself, it only needs the new count
+        self.playlist_listctrl.SetItemCount(self.playlist_manager.get_playlist_count())
     
     def _select_first_song(self):
         """Select the first song in the playlist."""
@@ -638,94 +807,319 @@ class MainFrame(wx.Frame):
         
         self._clear_recommendations_display()
         
-        # Check if file exists
-        if not os.path.isfile(song['path']):
-            # Try to find moved file
-            new_path = self.playlist_manager.find_moved_file(song['path'])
-            if new_path:
-                self.playlist_manager.update_song_path(index, new_path)
-                song['path'] = new_path
-            else:
-                log_warning(f"File missing: {song['path']}", "MainFrame")
-                DialogHelpers.show_error_message(self, "The file is missing.")
-                self.playlist_manager.remove_song(index)
-                self._refresh_playlist_display()
-                self._clear_playback()
-                # Try to play next song
-                self._on_next(None)
-                return
+        # Check if file exists; files listed when their folder was opened aren't stat'ed
+        if not self.playlist_manager.is_known_file(song['path']) and not os.path.isfile(song['path']):
+            self._search_moved_file(index, song)
+            return
+        
+        self._play_song(index, song)
+    
+    def _search_moved_file(self, index: int, song: dict):
+        """Look for a missing song file in the background; searching the folder tree can take a while."""
+        self._submit_io(
+            partial(self._on_moved_file_searched, index, song),
+            self.playlist_manager.find_moved_file, song['path']
+        )
+    
+    def _on_moved_file_searched(self, index: int, song: dict, new_path: Optional[str]):
+        """Play a song found at its new location, or drop it if it is gone."""
+        # Ignore results for a song that was removed or replaced in the meantime
+        if self.playlist_manager.get_song_by_index(index) is not song:
+            return
+        
+        if new_path:
+            self.playlist_manager.update_song_path(index, new_path)
+            self._play_song(index, song)
+            return
         
+        log_warning(f"File missing: {song['path']}", "MainFrame")
+        DialogHelpers.show_error_message(self, "The file is missing.")
+        self.playlist_manager.remove_song(index)
+        self.playlist_listctrl.remove_row(index, self.playlist_manager.get_playlist_count())
+        self._clear_playback()
+        # Try to play next song, which moved up into the removed song's row
+        self.current_song_index = index - 1
+        self._on_next(None)
+    
+    def _play_song(self, index: int, song: dict):
+        """Start playing a song whose file exists."""
         # Load the file
-        if self.media_player.load_file(song['path']):
-            self.playback_slider.SetRange(0, self.media_player.get_length())
-            self.playback_slider.SetValue(0)
-            self.media_player.play()
-            self.play_button.SetValue(True)
+        if not self.media_player.load_file(song['path']):
+            # The file was only known from its folder scan and may have moved since
+            if not os.path.isfile(song['path']):
+                self._search_moved_file(index, song)
+            return
+        
+        self._track_length = self.media_player.get_length()
+        self.playback_slider.SetRange(0, self._track_length)
+        self.playback_slider.SetValue(0)
+        self.media_player.play()
+        self.play_button.SetValue(True)
+        
+        # Update times played
+        times_played = self.playlist_manager.update_times_played(index)
+        self.playlist_listctrl.RefreshItem(index)
+        
+        # Use the metadata resolved while the previous song was playing, if any
+        if self._prefetched is not None and self._prefetched[0] == song['path']:
+            prefetched_song = self._prefetched[1]
+            self._prefetched = None
             
-            # Update times played
-            new_count = self.playlist_manager.update_times_played(index)
-            self.playlist_listctrl.SetItem(index, 3, str(new_count))
+            # The prefetched copy predates this play; only keep what AcoustID found
+            enhanced_song = dict(song)
+            if not song['artist']:
+                enhanced_song['artist'] = prefetched_song['artist']
+                enhanced_song['title'] = prefetched_song['title']
+            self._on_enhanced_metadata_ready(index, song['path'], times_played, enhanced_song)
+        else:
+            # Enhanced metadata may need an AcoustID fingerprint and lookup,
+            # so resolve it off the UI thread before loading art and recommendations
+            self._submit_io(
+                partial(self._on_enhanced_metadata_ready, index, song['path'], times_played),
+                self.playlist_manager.get_enhanced_metadata, song
+            )
+        
+        self._prefetch_song(index + 1)
+    
+    def _prefetch_song(self, index: int):
+        """Resolve metadata and album art for a song in the background before it is played."""
+        song = self.playlist_manager.get_song_by_index(index)
+        if not song:
+            return
+        
+        key = (song['artist'], song['title'])
+        self._submit_io(
+            partial(self._on_song_prefetched, song['path']),
+            self._find_song_details, song, key not in self._art_cache
+        )
+    
+    def _find_song_details(self, song: dict, find_art: bool):
+        """
+        Resolve enhanced metadata and, if asked, album art for a song; runs on a worker thread.
+        
+        Args:
+            song: Song dictionary
+            find_art: Whether album art should be looked up as well
             
-            # Get enhanced metadata if needed
-            enhanced_song = self.playlist_manager.get_enhanced_metadata(song)
+        Returns:
+            Tuple of (enhanced song, PIL image or None), or None if the file is missing
+        """
+        # A missing file is searched for when the song is played, not ahead of time
+        if not self.playlist_manager.is_known_file(song['path']) and not os.path.isfile(song['path']):
+            return None
+        
+        enhanced_song = self.playlist_manager.get_enhanced_metadata(song)
+        pil_image = self._find_album_art(enhanced_song) if find_art else None
+        return enhanced_song, pil_image
+    
+    def _on_song_prefetched(self, path: str, details: Optional[tuple]):
+        """Keep details resolved ahead of time until the song is played."""
+        if details is None:
+            return
+        
+        enhanced_song, pil_image = details
+        self._prefetched = (path, enhanced_song)
+        if pil_image:
+            self._remember_album_art((enhanced_song['artist'], enhanced_song['title']), pil_image)
+    
+    def _on_enhanced_metadata_ready(self, index: int, path: str, times_played: int, enhanced_song: dict):
+        """Load album art and recommendations once enhanced metadata is available."""
+        # Ignore results for a song that is no longer loaded
+        if self.media_player.current_file != path:
+            return
+        
+        self._load_album_art(enhanced_song)
+        self._load_recommendations(enhanced_song, times_played)
+    
+    def _enrich_songs(self, songs: list):
+        """Identify untagged songs from a loaded batch in the background."""
+        if any(not song['artist'] for song in songs):
+            self._submit_io(self._on_songs_enriched, self.playlist_manager.enrich_songs, songs)
+    
+    def _on_songs_enriched(self, results: list):
+        """Show artist and title found for untagged songs."""
+        for index in self.playlist_manager.apply_enriched_metadata(results):
+            self.playlist_listctrl.RefreshItem(index)
+    
+    def _submit_io(self, callback: Callable, func: Callable, *args) -> Future:
+        """
+        Run a blocking function on the I/O pool and hand its result to the UI thread.
+        
+        Args:
+            callback: Function called on the UI thread with the result
+            func: Blocking function to run on a worker thread
+            *args: Arguments for func
             
-            # Load album art and recommendations
-            self._load_album_art(enhanced_song)
-            self._load_recommendations(enhanced_song, index)
+        Returns:
+            Future for the submitted work
+        """
+        future = self._io_pool.submit(func, *args)
+        future.add_done_callback(
+            lambda done: wx.CallAfter(self._deliver_io_result, callback, done)
+        )
+        return future
+    
+    def _deliver_io_result(self, callback: Callable, future: Future):
+        """Deliver a finished background result on the UI thread."""
+        # The frame may have been destroyed while the work was running
+        if not self or future.cancelled():
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            log_error("Background task failed", e, "MainFrame")
+            return
+        
+        callback(result)
     
     def _load_album_art(self, song: dict):
-        """Load album art for a song."""
+        """Load album art for a song, from memory if it was shown recently."""
+        key = (song['artist'], song['title'])
+        bitmap = self._art_cache.get(key)
+        if bitmap is not None:
+            self._art_cache.move_to_end(key)
+            self.album_art_display.SetBitmap(bitmap)
+            return
+        
+        self._submit_io(
+            partial(self._on_album_art_ready, song['path'], key),
+            self._find_album_art, song
+        )
+    
+    def _find_album_art(self, song: dict):
+        """
+        Read embedded album art, or download it from LastFM; runs on a worker thread.
+        
+        The image is decoded and fitted to the display size here as well, so the
+        UI thread only converts it to a bitmap.
+        
+        Args:
+            song: Song dictionary
+            
+        Returns:
+            PIL Image or None if no album art was found
+        """
+        pil_image = None
+        
         # First try embedded album art
         embedded_art = MetadataExtractor.get_embedded_album_art(song['path'])
         if embedded_art:
-            pil_image = ImageProcessor.bytes_to_pil_image(embedded_art)
-            if pil_image:
-                ImageProcessor.display_image_on_static_bitmap(
-                    self.album_art_display, pil_image, ALBUM_ART_SIZE
-                )
-                return
+            pil_image = ImageProcessor.bytes_to_pil_image(embedded_art, ALBUM_ART_SIZE)
         
         # Try LastFM if we have artist and title
-        if song['artist'] and song['title'] and self.lastfm_api.is_configured():
+        if not pil_image and song['artist'] and song['title'] and self.lastfm_api.is_configured():
             try:
                 pil_image = self.lastfm_api.download_album_art(
-                    song['artist'], song['title'], 'extralarge'
+                    song['artist'], song['title'],
+                    self.lastfm_api.image_size_for(ALBUM_ART_SIZE), ALBUM_ART_SIZE
                 )
-                if pil_image:
-                    ImageProcessor.display_image_on_static_bitmap(
-                        self.album_art_display, pil_image, ALBUM_ART_SIZE
-                    )
-                    return
             except Exception as e:
                 log_error("Failed to load album art from LastFM", e, "MainFrame")
         
-        # Fall back to blank image
-        self._clear_album_art()
+        if not pil_image:
+            return None
+        
+        try:
+            fitted = ImageProcessor.resize_image_to_fit(pil_image, *ALBUM_ART_SIZE)
+            
+            # Convert covers without transparency to RGB here, so the UI thread
+            # copies the pixels into a bitmap without a format conversion
+            if fitted.mode not in ('RGB', 'RGBA', 'LA') and 'transparency' not in fitted.info:
+                fitted = fitted.convert('RGB')
+            return fitted
+        except Exception as e:
+            log_error("Failed to decode album art", e, "MainFrame")
+            return None
     
-    def _load_recommendations(self, song: dict, song_index: int):
-        """Load recommendations for a song."""
+    def _on_album_art_ready(self, path: str, key: tuple, pil_image):
+        """Display album art found in the background, or a blank image."""
+        # Remember the art even if the user already moved on, so going back is instant
+        bitmap = self._remember_album_art(key, pil_image) if pil_image else None
+        
+        # Ignore results for a song that is no longer loaded
+        if self.media_player.current_file != path:
+            return
+        
+        if bitmap is not None:
+            self.album_art_display.SetBitmap(bitmap)
+        else:
+            # Fall back to blank image
+            self._clear_album_art()
+    
+    def _remember_album_art(self, key: tuple, pil_image) -> Optional[wx.Bitmap]:
+        """
+        Convert album art to a bitmap and keep it in the in-memory cache.
+        
+        Args:
+            key: (artist, title) of the song
+            pil_image: Album art already fitted to ALBUM_ART_SIZE by _find_album_art
+            
+        Returns:
+            Cached bitmap, or None if the image could not be converted
+        """
+        try:
+            bitmap = ImageProcessor.pil_to_wx_bitmap(pil_image)
+        except Exception as e:
+            log_error("Failed to convert album art", e, "MainFrame")
+            return None
+        
+        self._art_cache[key] = bitmap
+        self._art_cache.move_to_end(key)
+        if len(self._art_cache) > ALBUM_ART_MEMORY_CACHE_SIZE:
+            self._art_cache.popitem(last=False)
+        return bitmap
+    
+    def _load_recommendations(self, song: dict, times_played: int):
+        """Load recommendations for a song, given its play count including this play."""
         if not song['artist'] or not song['title']:
             return
         
-        # Only get recommendations if song hasn't been played much
-        times_played = self.playlist_manager.db_manager.get_times_played(song['path'])
+        # Only get recommendations if song hasn't been played much; the count
+        # kept with the song matches the stored one, so the database isn't read here
         if times_played > 1:
             return
         
-        try:
-            recommendations = self.playlist_manager.get_recommendations(
-                song['artist'], song['title']
-            )
-            self._display_recommendations(recommendations, song['artist'])
-        except Exception as e:
-            log_error("Failed to load recommendations", e, "MainFrame")
+        # Wait briefly, so skipping through several songs sends one request for the last
+        if self._recommendations_call is not None:
+            self._recommendations_call.Stop()
+        self._recommendations_call = wx.CallLater(
+            RECOMMENDATIONS_DELAY_MS, self._request_recommendations, song
+        )
+    
+    def _request_recommendations(self, song: dict):
+        """Fetch recommendations in the background if the song is still loaded."""
+        self._recommendations_call = None
+        if self.media_player.current_file != song['path']:
+            return
+        
+        # Spotify search and recommendation calls are network bound
+        self._submit_io(
+            partial(self._on_recommendations_ready, song['path'], song['artist']),
+            self.playlist_manager.get_recommendations, song['artist'], song['title']
+        )
+    
+    def _on_recommendations_ready(self, path: str, artist_name: str, recommendations: list):
+        """Display recommendations fetched in the background."""
+        # Ignore results for a song that is no longer loaded
+        if self.media_player.current_file != path:
+            return
+        
+        self._display_recommendations(recommendations, artist_name)
     
     def _display_recommendations(self, recommendations: list, artist_name: str):
         """Display recommendations in the recommendations list."""
-        self._clear_recommendations_display()
-        
-        for i, rec in enumerate(recommendations):
-            if rec.get('seed_artist_name') == artist_name:
-                self.recommendations_listctrl.InsertItem(i, rec['artist'])
-                self.recommendations_listctrl.SetItem(i, 1, rec['title'])
-                self.recommendations_listctrl.SetItem(i, 2, '0:30')  # Preview duration
\ No newline at end of file
+        # Suspend repaints while the rows are filled in, so the list paints once
+        self.recommendations_listctrl.Freeze()
+        try:
+            self._clear_recommendations_display()
+            
+            for rec in recommendations:
+                if rec.get('seed_artist_name') == artist_name:
+                    row = len(self._recommendation_rows)
+                    self.recommendations_listctrl.InsertItem(row, rec['artist'])
+                    self.recommendations_listctrl.SetItem(row, 1, rec['title'])
+                    self.recommendations_listctrl.SetItem(row, 2, '0:30')  # Preview duration
+                    self._recommendation_rows.append(rec)
+        finally:
+            self.recommendations_listctrl.Thaw()
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Playlist list control for SMF Player.
+Shows the playlist in a virtual list that reads rows from the playlist manager on demand.
+"""
+
+import wx
+from typing import Callable, Dict, Optional
+
+# Column heading, song key and width for each playlist column
+PLAYLIST_COLUMNS = (
+    ("Artist", 'artist', 170),
+    ("Title", 'title', 170),
+    ("Duration", 'duration', 70),
+    ("Counter", 'times_played', 70),
+    ("Rating", 'rating', 70),
+)
+
+
+class PlaylistListCtrl(wx.ListCtrl):
+    """Virtual report list that asks for each visible cell instead of storing every row."""
+    
+    def __init__(
+        self,
+        parent: wx.Window,
+        get_song: Callable[[int], Optional[Dict[str, str]]],
+        size: tuple,
+        pos: tuple
+    ):
+        """
+        Initialize the playlist list control.
+        
+        Args:
+            parent: Parent window
+            get_song: Function returning the song at a playlist index, or None
+            size: Control size
+            pos: Control position
+        """
+        super().__init__(parent, size=size, pos=pos, style=wx.LC_REPORT | wx.LC_VIRTUAL)
+        self._get_song = get_song
+        self._column_keys = tuple(key for heading, key, width in PLAYLIST_COLUMNS)
+        
+        for heading, key, width in PLAYLIST_COLUMNS:
+            self.AppendColumn(heading, width=width)
+    
+    def OnGetItemText(self, item: int, col: int) -> str:
+        """
+        Get the text of a cell when the control paints it.
+        
+        Args:
+            item: Row index
+            col: Column index
+        
+        Returns:
+            Cell text
+        """
+        song = self._get_song(item)
+        if song is None:
+            return ''
+        
+        value = song[self._column_keys[col]]
+        return value if isinstance(value, str) else str(value)
+    
+    def set_row_count(self, count: int):
+        """
+        Show the given number of playlist rows and repaint the visible ones.
+        
+        Args:
+            count: Number of songs in the playlist
+        """
+        self.SetItemCount(count)
+        if count:
+            self.RefreshItems(0, count - 1)
+    
+    def remove_row(self, index: int, count: int):
+        """
+        Drop one row, repainting only the rows that moved up.
+        
+        Args:
+            index: Index of the removed song
+            count: Number of songs left in the playlist
+        """
+        self.SetItemCount(count)
+        if index < count:
+            self.RefreshItems(index, count - 1)
\ No newline at end of file
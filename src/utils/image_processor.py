@@ -3,17 +3,51 @@ Image processing utilities for SMF Player.
 Handles image manipulation and conversion between PIL and wx formats.
 """
 
+import math
 import wx
-from PIL import Image
+import PIL
+from PIL import Image, features
+from functools import lru_cache
 from io import BytesIO
 from typing import Optional
 
 from .logging_utils import log_error
 
 
+# How close to the target size a box-filter prereduction may shrink an image before
+# the final LANCZOS pass; Pillow documents 3 as indistinguishable from LANCZOS alone,
+# smaller gaps are faster but visibly softer
+REDUCING_GAP = 3.0
+
+# How much smaller than the exact fit a fast thumbnail may come out of a plain integer
+# box reduction before it falls back to LANCZOS
+FAST_THUMBNAIL_TOLERANCE = 0.1
+
+
+@lru_cache(maxsize=8)
+def _blank_bitmap(width: int, height: int) -> wx.Bitmap:
+    """Create a blank bitmap once per size; bitmaps that are only displayed can be shared."""
+    return wx.Bitmap(wx.Image(width, height))
+
+
 class ImageProcessor:
     """Handles image processing operations for the music player."""
     
+    @staticmethod
+    def describe_build() -> str:
+        """
+        Describe the installed imaging library, so logs show which resampler is in use.
+        
+        Returns:
+            Library name and version, and the JPEG decoder it is linked against
+        """
+        # Pillow-SIMD releases carry a .postN suffix on the Pillow version they track
+        name = "Pillow-SIMD" if '.post' in PIL.__version__ else "Pillow"
+        
+        # Pillow's wheels bundle libjpeg-turbo; source builds use whatever libjpeg is installed
+        jpeg = "libjpeg-turbo" if features.check_feature('libjpeg_turbo') else "libjpeg"
+        return f"{name} {PIL.__version__} with {jpeg}"
+    
     @staticmethod
     def scale_bitmap(bitmap: wx.Bitmap, width: int = 25, height: int = 30) -> wx.Bitmap:
         """
@@ -42,18 +76,16 @@ class ImageProcessor:
         Returns:
             wx.Image object
         """
-        wx_image = wx.Image(pil_image.size[0], pil_image.size[1])
-        
-        # Convert to RGB and set data
-        rgb_data = pil_image.convert('RGB').tobytes()
-        wx_image.SetData(rgb_data)
+        # Build the image straight from the RGB bytes rather than filling a blank one;
+        # RGB images, such as fitted album art, are not converted again
+        rgb_image = pil_image if pil_image.mode == 'RGB' else pil_image.convert('RGB')
+        wx_image = wx.Image(pil_image.size[0], pil_image.size[1], rgb_image.tobytes())
         
-        # Handle alpha channel if present
+        # Handle alpha channel if present; getchannel copies just the alpha plane in C
         if pil_image.mode in ('RGBA', 'LA') or 'transparency' in pil_image.info:
-            if pil_image.mode != 'RGBA':
+            if pil_image.mode not in ('RGBA', 'LA'):
                 pil_image = pil_image.convert('RGBA')
-            alpha_data = pil_image.tobytes()[3::4]
-            wx_image.SetAlphaData(alpha_data)
+            wx_image.SetAlphaData(pil_image.getchannel('A').tobytes())
         
         return wx_image
     
@@ -68,22 +100,36 @@ class ImageProcessor:
         Returns:
             wx.Bitmap object
         """
+        # RGB and RGBA pixels go straight into the native bitmap, without a wx.Image
+        width, height = pil_image.size
+        if pil_image.mode == 'RGB':
+            return wx.Bitmap.FromBuffer(width, height, pil_image.tobytes())
+        if pil_image.mode == 'RGBA':
+            return wx.Bitmap.FromBufferRGBA(width, height, pil_image.tobytes())
+        
         wx_image = ImageProcessor.pil_to_wx_image(pil_image)
         return wx.Bitmap(wx_image)
     
     @staticmethod
-    def bytes_to_pil_image(image_bytes: bytes) -> Optional[Image.Image]:
+    def bytes_to_pil_image(image_bytes: bytes, target_size: Optional[tuple] = None) -> Optional[Image.Image]:
         """
         Convert bytes data to PIL Image.
         
         Args:
             image_bytes: Image data as bytes
+            target_size: Size the image will be displayed at; JPEGs larger than it
+                are decoded at a reduced scale. The image is decoded right away, so
+                corrupt data fails here. Without it decoding is left to the caller
             
         Returns:
             PIL Image object or None if conversion fails
         """
         try:
-            return Image.open(BytesIO(image_bytes))
+            image = Image.open(BytesIO(image_bytes))
+            if target_size is not None:
+                ImageProcessor._draft_jpeg(image, *target_size)
+                image.load()
+            return image
         except Exception as e:
             log_error(f"Error converting bytes to PIL image", e, "ImageProcessor")
             return None
@@ -101,42 +147,74 @@ class ImageProcessor:
         Returns:
             Resized PIL Image
         """
-        # Calculate the aspect ratio
-        aspect_ratio = image.width / image.height
-        
-        # Calculate new dimensions
-        if aspect_ratio > 1:  # Wider than tall
-            new_width = min(max_width, image.width)
-            new_height = int(new_width / aspect_ratio)
-        else:  # Taller than wide or square
-            new_height = min(max_height, image.height)
-            new_width = int(new_height * aspect_ratio)
-        
-        # Ensure we don't exceed maximum dimensions
-        if new_width > max_width:
-            new_width = max_width
-            new_height = int(new_width / aspect_ratio)
-        if new_height > max_height:
-            new_height = max_height
-            new_width = int(new_height * aspect_ratio)
-        
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        ImageProcessor._draft_jpeg(image, max_width, max_height)
+        
+        # Scale down to fit both dimensions, never up
+        scale = min(max_width / image.width, max_height / image.height, 1.0)
+        new_width = max(1, round(image.width * scale))
+        new_height = max(1, round(image.height * scale))
+        
+        # Large sources are first shrunk by an integer factor with a cheap box filter
+        # to within REDUCING_GAP of the target, so LANCZOS only runs on the remainder
+        return image.resize(
+            (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP
+        )
     
     @staticmethod
-    def create_thumbnail(image: Image.Image, size: tuple = (500, 500)) -> Image.Image:
+    def create_thumbnail(image: Image.Image, size: tuple = (500, 500), fast: bool = False) -> Image.Image:
         """
         Create a thumbnail of an image.
         
+        Unlike Image.thumbnail, the source isn't copied first; the resize writes
+        straight into the thumbnail-sized result. The source is left as it is,
+        except that a JPEG not decoded yet is drafted to decode at a reduced scale.
+        
         Args:
             image: PIL Image to create thumbnail from
             size: Thumbnail size as (width, height)
+            fast: Shrink by a whole factor with a box filter alone when that lands
+                close enough to the size; faster, but may alias fine detail.
+                Palette and bilevel images always take the LANCZOS path
             
         Returns:
-            Thumbnail PIL Image
+            Thumbnail PIL Image, a new image even if the source already fits
+        """
+        ImageProcessor._draft_jpeg(image, *size)
+        
+        width, height = image.size
+        scale = min(size[0] / width, size[1] / height)
+        if scale >= 1:
+            # Copying an image that fits is cheap, and callers may change the result
+            return image.copy()
+        
+        thumbnail_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        
+        # Averaging palette indexes or bilevel pixels would give wrong colors
+        if fast and image.mode not in ('1', 'P'):
+            # Smallest whole factor that fits, e.g. 2 for 1000 -> 500 or 3 for 1500 -> 500
+            factor = math.ceil(max(width / size[0], height / size[1]))
+            reduced_width = math.ceil(width / factor)
+            if reduced_width >= thumbnail_size[0] * (1 - FAST_THUMBNAIL_TOLERANCE):
+                return image.reduce(factor)
+        
+        return image.resize(thumbnail_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+    
+    @staticmethod
+    def _draft_jpeg(image: Image.Image, max_width: int, max_height: int):
+        """
+        Let libjpeg decode a JPEG at 1/2, 1/4 or 1/8 scale when it is much larger than needed.
+        
+        The scaled decode stays at least twice the target size, so the LANCZOS pass
+        that follows still has detail to work with. Has no effect on other formats
+        or on images that were already decoded.
+        
+        Args:
+            image: PIL Image that may not be decoded yet
+            max_width: Width the image will be resized to fit
+            max_height: Height the image will be resized to fit
         """
-        thumbnail = image.copy()
-        thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
-        return thumbnail
+        if getattr(image, 'format', None) == 'JPEG':
+            image.draft('RGB', (max_width * 2, max_height * 2))
     
     @staticmethod
     def display_image_on_static_bitmap(static_bitmap: wx.StaticBitmap, 
@@ -152,8 +230,7 @@ class ImageProcessor:
         """
         if pil_image is None:
             # Set blank bitmap
-            blank_image = wx.Image(max_size[0], max_size[1])
-            static_bitmap.SetBitmap(wx.Bitmap(blank_image))
+            static_bitmap.SetBitmap(ImageProcessor.create_blank_bitmap(*max_size))
             return
         
         try:
@@ -169,20 +246,18 @@ class ImageProcessor:
         except Exception as e:
             log_error(f"Error displaying image", e, "ImageProcessor")
             # Fall back to blank image
-            blank_image = wx.Image(max_size[0], max_size[1])
-            static_bitmap.SetBitmap(wx.Bitmap(blank_image))
+            static_bitmap.SetBitmap(ImageProcessor.create_blank_bitmap(*max_size))
     
     @staticmethod
     def create_blank_bitmap(width: int, height: int) -> wx.Bitmap:
         """
-        Create a blank bitmap of specified dimensions.
+        Get a blank bitmap of specified dimensions.
         
         Args:
             width: Bitmap width
             height: Bitmap height
             
         Returns:
-            Blank wx.Bitmap
+            Blank wx.Bitmap, shared between callers asking for the same size
         """
-        blank_image = wx.Image(width, height)
-        return wx.Bitmap(blank_image)
\ No newline at end of file
+        return _blank_bitmap(width, height)
\ No newline at end of file
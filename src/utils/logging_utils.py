@@ -3,13 +3,22 @@ Centralized logging utilities for SMF Player.
 Provides consistent logging across the application with configurable output.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
 # Global logger instance
 _logger: Optional[logging.Logger] = None
 
+# Background thread that writes queued records to the log file, if one is set up
+_file_listener: Optional[QueueListener] = None
+
+# Child loggers by name, so the log helpers don't go through getChild on every message
+_child_loggers: Dict[str, logging.Logger] = {}
+
 
 def setup_logging(
     level: int = logging.INFO,
@@ -26,14 +35,16 @@ def setup_logging(
         log_to_file: Whether to log to a file in addition to console
         log_file_path: Path to the log file if log_to_file is True
     """
-    global _logger
+    global _logger, _file_listener
     
     # Create logger
     _logger = logging.getLogger("SMFPlayer")
+    _child_loggers.clear()
     _logger.setLevel(level)
     
-    # Clear any existing handlers
+    # Clear any existing handlers, writing out records still queued for the old file
     _logger.handlers.clear()
+    _stop_file_listener()
     
     # Create formatter
     formatter = logging.Formatter(format_string)
@@ -44,15 +55,34 @@ def setup_logging(
     console_handler.setFormatter(formatter)
     _logger.addHandler(console_handler)
     
-    # File handler (optional)
+    # File handler (optional); records are queued and written on a background
+    # thread, so logging from the UI thread never waits on the disk
     if log_to_file:
         try:
             file_handler = logging.FileHandler(log_file_path)
             file_handler.setLevel(level)
             file_handler.setFormatter(formatter)
-            _logger.addHandler(file_handler)
+            
+            log_queue = queue.SimpleQueue()
+            _logger.addHandler(QueueHandler(log_queue))
+            _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            _file_listener.start()
         except Exception as e:
-            _logger.error(f"Failed to create file handler for {log_file_path}: {e}")
+            _logger.error("Failed to create file handler for %s: %s", log_file_path, e)
+
+
+def _stop_file_listener() -> None:
+    """Write out queued log records, stop the file writer thread and close the file."""
+    global _file_listener
+    
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
 
 
 def get_logger(name: str = "SMFPlayer") -> logging.Logger:
@@ -65,15 +95,19 @@ def get_logger(name: str = "SMFPlayer") -> logging.Logger:
     Returns:
         Logger instance
     """
-    global _logger
+    logger = _child_loggers.get(name)
+    if logger is not None:
+        return logger
     
     if _logger is None:
         setup_logging()
     
     if name == "SMFPlayer":
-        return _logger
+        logger = _logger
     else:
-        return _logger.getChild(name)
+        logger = _logger.getChild(name)
+    _child_loggers[name] = logger
+    return logger
 
 
 def log_error(message: str, exception: Optional[Exception] = None, logger_name: str = "SMFPlayer") -> None:
@@ -87,7 +121,8 @@ def log_error(message: str, exception: Optional[Exception] = None, logger_name:
     """
     logger = get_logger(logger_name)
     if exception:
-        logger.error(f"{message}: {exception}")
+        # The exception is only turned into text if a handler takes the record
+        logger.error("%s: %s", message, exception)
     else:
         logger.error(message)
 
@@ -120,6 +155,9 @@ def log_debug(message: str, logger_name: str = "SMFPlayer") -> None:
     """
     Convenience function to log debug messages.
     
+    The message is built before this is called, even when debug logging is off;
+    on hot paths call get_logger(name).debug("...%s", value) so formatting is skipped.
+    
     Args:
         message: Debug message
         logger_name: Name of the logger to use